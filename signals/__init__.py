@@ -6,8 +6,16 @@ signals == Signal-Slot Event Processing Library
 """
 
 # Inform users of any missing hard dependencies
-from ._signals import (Signal, SignalPriority, join, shutdown, getSignalProcessor,
-                       registerEmission, SignalTask, SignalFactory)
+from ._signals import (Signal, SignalPriority, Connection, ConnectionGroup, join, shutdown, getSignalProcessor, setSignalProcessor,
+                       processorStats, DEFAULT_PROCESSOR,
+                       getProcessProcessor, PriorityProcessPoolExecutor,
+                       enableMetrics, disableMetrics, metricsSnapshot,
+                       getErrorReporter, setErrorReporter, errorOccurred,
+                       registerEmission, registerEmissions, SignalTask, SignalFactory,
+                       PriorityHeapQueue, PriorityLevelQueue, WorkStealingQueue,
+                       DispatchMode, OverflowPolicy)
+from ._async import AsyncSignalProcessor
+from ._errors import ErrorReporter, LoggingSink, RingBufferSink, SignalSink
 
 hard_dependencies = ['typing']
 missing_dependencies = []  # dependency strings
@@ -29,5 +37,12 @@ del hard_dependencies, dependency, missing_dependencies
 __version__ = (0, 0, 3)
 
 # All members that can be imported
-__all__ = ["Signal", "SignalPriority", "join", "shutdown",
-           "SignalTask", "registerEmission", "getSignalProcessor"]
+__all__ = ["Signal", "SignalPriority", "Connection", "ConnectionGroup", "join", "shutdown",
+           "SignalTask", "registerEmission", "registerEmissions", "getSignalProcessor",
+           "setSignalProcessor", "processorStats", "DEFAULT_PROCESSOR", "AsyncSignalProcessor",
+           "getProcessProcessor", "PriorityProcessPoolExecutor",
+           "enableMetrics", "disableMetrics", "metricsSnapshot",
+           "getErrorReporter", "setErrorReporter", "errorOccurred", "ErrorReporter",
+           "LoggingSink", "RingBufferSink", "SignalSink",
+           "PriorityHeapQueue", "PriorityLevelQueue", "WorkStealingQueue",
+           "DispatchMode", "OverflowPolicy"]
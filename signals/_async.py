@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Package: signals
+File:    _async.py
+
+Python Version: 3.10
+
+asyncio backend for signal dispatch. An AsyncSignalProcessor can be installed
+with setSignalProcessor() in place of the PriorityThreadPoolExecutor, running
+every slot on a single event loop instead of on worker threads.
+
+"""
+import asyncio
+import heapq
+import inspect
+import threading
+import weakref
+from concurrent.futures import Future
+
+from ._signals import PriorityWorkItem, SignalPriority, _sequence, _worker_state
+
+
+class AsyncSignalProcessor:
+    """
+    Signal processor scheduling slots on an asyncio event loop.
+
+    Submissions from any thread enter a priority-ordered ready queue. The loop
+    takes one item at a time from that queue in a loop.call_soon callback, so
+    priorities are honored at every step: synchronous slots run inside that
+    callback, while `async def` slots are started as tasks on the loop.
+
+    Synchronous slots run on the event loop thread and must not block it.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop = None):
+        """
+        :param loop: asyncio.AbstractEventLoop = None
+            Loop slots run on; defaults to the running loop of the calling thread.
+        """
+        self._loop = loop if loop is not None else asyncio.get_running_loop()
+        self._ready = []  # heap of PriorityWorkItem, task is (fn, args, future)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._scheduled = False
+        self._pending = 0  # submitted and not yet finished
+        self._waiters = []  # asyncio futures resolved when _pending reaches 0
+        self._shutdown = False
+        self._owner = weakref.ref(self)  # identifies this processor to DispatchMode.AUTO
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """
+        Queue fn(*args, **kwargs) to run on the event loop.
+
+        Accepts the same priority keyword as PriorityThreadPoolExecutor.submit.
+        Returns a concurrent.futures.Future resolved with the slot's result,
+        awaiting it first if the slot returned an awaitable.
+        """
+        priority = kwargs.pop('priority', SignalPriority.NORMAL)
+        future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            heapq.heappush(self._ready, PriorityWorkItem(
+                priority, next(_sequence), (fn, args, kwargs, future)))
+            self._pending += 1
+            schedule = not self._scheduled
+            self._scheduled = True
+        if schedule:
+            self._loop.call_soon_threadsafe(self._step)
+        return future
+
+    def _step(self):
+        """
+        Run the most urgent ready item, then yield back to the loop.
+        """
+        with self._lock:
+            fn, args, kwargs, future = heapq.heappop(self._ready).task
+        if future.set_running_or_notify_cancel():
+            _worker_state.active = True
+            _worker_state.owner = self._owner
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+                self._finished()
+            else:
+                if inspect.isawaitable(result):
+                    task = asyncio.ensure_future(result, loop=self._loop)
+                    task.add_done_callback(lambda t: self._resolve(t, future))
+                else:
+                    future.set_result(result)
+                    self._finished()
+            finally:
+                _worker_state.active = False
+                _worker_state.owner = None
+        else:
+            self._finished()
+
+        with self._lock:
+            self._scheduled = bool(self._ready)
+            if self._scheduled:
+                self._loop.call_soon(self._step)
+
+    def _resolve(self, task: asyncio.Future, future: Future):
+        try:
+            future.set_result(task.result())
+        except BaseException as e:
+            # includes CancelledError for a task cancelled on the loop
+            future.set_exception(e)
+        self._finished()
+
+    def _finished(self):
+        with self._lock:
+            self._pending -= 1
+            if self._pending:
+                return
+            self._idle.notify_all()
+            waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def stats(self) -> dict:
+        """
+        Number of items waiting in the ready queue, and submitted but not finished.
+        """
+        with self._lock:
+            return {'queued': len(self._ready), 'pending': self._pending}
+
+    def _on_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def join(self):
+        """
+        Block until every submitted slot has finished. Use `await wait()` on the loop thread.
+        """
+        if self._on_loop_thread():
+            raise RuntimeError(
+                'join() would block the event loop; await AsyncSignalProcessor.wait() instead')
+        with self._idle:
+            self._idle.wait_for(lambda: self._pending == 0)
+
+    async def wait(self):
+        """
+        Wait, on the event loop, until every submitted slot has finished.
+        """
+        with self._lock:
+            if self._pending == 0:
+                return
+            waiter = self._loop.create_future()
+            self._waiters.append(waiter)
+        await waiter
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop accepting submissions, optionally waiting for queued slots to finish.
+        Waiting is skipped when called from the event loop thread.
+        """
+        with self._lock:
+            self._shutdown = True
+        if wait and not self._on_loop_thread():
+            self.join()
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+Package: signals
+File:    _errors.py
+
+Python Version: 3.10
+
+Error reporting for exceptions raised by slots. Workers only hand the raw
+exception to an ErrorReporter; a reporter thread deduplicates, rate limits and
+formats it, then passes a record to each configured sink.
+
+"""
+import logging
+import queue
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Callable, Iterable
+
+
+class LoggingSink:
+    """
+    Sink writing each record to a logger, traceback included.
+    """
+
+    def __init__(self, logger: logging.Logger = None, level: int = logging.ERROR):
+        """
+        :param logger: logging.Logger = None
+            Logger to write to; defaults to the 'signals' logger.
+        :param level: int = logging.ERROR
+            Level records are logged at.
+        """
+        self.logger = logger if logger is not None else logging.getLogger('signals')
+        self.level = level
+
+    def __call__(self, record: dict):
+        e = record['exception']
+        repeated = f' (x{record["count"]})' if record['count'] > 1 else ''
+        self.logger.log(self.level, 'Slot raised %s: %s in thread %s%s',
+                        record['type'], record['message'], record['thread'], repeated,
+                        exc_info=(type(e), e, e.__traceback__))
+
+
+class RingBufferSink:
+    """
+    Sink keeping the most recent records in memory.
+    """
+
+    def __init__(self, capacity: int = 100):
+        self._records = deque(maxlen=capacity)
+
+    def __call__(self, record: dict):
+        self._records.append(record)
+
+    def records(self) -> list:
+        """
+        Stored records, oldest first.
+        """
+        return list(self._records)
+
+    def clear(self):
+        self._records.clear()
+
+
+class SignalSink:
+    """
+    Sink emitting each record on a signal taking a single dict.
+    """
+
+    def __init__(self, signal):
+        self.signal = signal
+
+    def __call__(self, record: dict):
+        if self.signal.connected:
+            self.signal.emit(record)
+
+
+class _Flush:
+    __slots__ = ('done',)
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class ErrorReporter:
+    """
+    Collects exceptions raised by slots and delivers them to sinks from a
+    dedicated thread.
+
+    report() only queues the exception, so a failing slot costs its worker a
+    non-blocking put; when more than max_pending exceptions wait, new ones are
+    dropped and counted. Identical failures (same exception type raised through
+    the same code locations) within dedup_window seconds are folded into one
+    record whose 'count' gives the number of occurrences, and at most
+    rate_limit records per second reach the sinks.
+
+    Sinks are callables taking a record dict with the keys 'type', 'message',
+    'thread', 'time', 'count', 'trace' and 'exception'.
+    """
+
+    def __init__(self, sinks: Iterable[Callable] = None, max_pending: int = 1024,
+                 rate_limit: float = 100.0, dedup_window: float = 1.0):
+        """
+        :param sinks: Iterable[Callable] = None
+            Sinks receiving records; defaults to a LoggingSink.
+        :param max_pending: int = 1024
+            Number of exceptions that may wait for the reporter thread.
+        :param rate_limit: float = 100.0
+            Records delivered per second, with bursts of the same size. None disables it.
+        :param dedup_window: float = 1.0
+            Seconds identical failures are folded together. 0 disables it.
+        """
+        self.sinks = list(sinks) if sinks is not None else [LoggingSink()]
+        self.rate_limit = rate_limit
+        self.dedup_window = dedup_window
+        self._pending = queue.Queue(max_pending)
+        self._recent = {}  # failure key -> [window end, repeats, exception, thread, time]
+        self._burst = max(rate_limit, 1.0) if rate_limit is not None else None
+        self._tokens = self._burst
+        self._refilled = time.monotonic()
+        self._tick = min(dedup_window, 0.1) if dedup_window else None
+        self._next_sweep = 0.0
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self.dropped = 0
+        self.delivered = 0
+        self.deduplicated = 0
+        self.suppressed = 0
+        self.sink_errors = 0
+
+    def report(self, e: BaseException):
+        """
+        Queue an exception for reporting. Safe to call from any thread.
+        """
+        if self._thread is None:
+            self._start()
+        try:
+            self._pending.put_nowait((e, threading.current_thread().name, time.time()))
+        except queue.Full:
+            with self._start_lock:
+                self.dropped += 1
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Deliver every exception reported so far, including repeats still held
+        for deduplication. Returns False if timeout expired first.
+        """
+        thread = self._thread
+        if thread is None or thread is threading.current_thread() or not thread.is_alive():
+            return True
+        marker = _Flush()
+        self._pending.put(marker)
+        return marker.done.wait(timeout)
+
+    def close(self):
+        """
+        Flush, then stop the reporter thread.
+        """
+        self.flush()
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._pending.put(_STOP)
+            thread.join()
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name='SignalErrorReporter',
+                                          daemon=True)
+                thread.start()
+                self._thread = thread
+
+    def _run(self):
+        while True:
+            try:
+                item = self._pending.get(timeout=self._tick)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                return
+            if isinstance(item, _Flush):
+                self._sweep(None)
+                item.done.set()
+                continue
+            if item is not None:
+                self._handle(*item)
+            now = time.monotonic()
+            if now >= self._next_sweep:
+                self._sweep(now)
+                self._next_sweep = now + (self._tick or 0.0)
+
+    def _handle(self, e: BaseException, thread: str, when: float):
+        if not self.dedup_window:
+            self._deliver(e, thread, when, 1)
+            return
+        # walking the traceback is much cheaper than extracting it
+        locations = []
+        tb = e.__traceback__
+        while tb is not None:
+            locations.append((tb.tb_frame.f_code, tb.tb_lineno))
+            tb = tb.tb_next
+        key = (type(e), tuple(locations))
+
+        now = time.monotonic()
+        entry = self._recent.get(key)
+        if entry is not None and now < entry[0]:
+            entry[1] += 1
+            entry[2:] = (e, thread, when)
+            self.deduplicated += 1
+            return
+        self._recent[key] = [now + self.dedup_window, 0, None, None, None]
+        self._deliver(e, thread, when, 1)
+
+    def _sweep(self, now: float = None):
+        """
+        Deliver repeats whose window ended, or all of them if now is None.
+        A failure that keeps repeating yields one record per window.
+        """
+        for key, entry in list(self._recent.items()):
+            if now is not None and now < entry[0]:
+                continue
+            window_end, repeats, e, thread, when = entry
+            if repeats:
+                self._recent[key] = [(now or time.monotonic()) + self.dedup_window,
+                                     0, None, None, None]
+                self._deliver(e, thread, when, repeats)
+            else:
+                del self._recent[key]
+
+    def _deliver(self, e: BaseException, thread: str, when: float, count: int):
+        if self.rate_limit is not None:
+            now = time.monotonic()
+            self._tokens = min(self._burst,
+                               self._tokens + (now - self._refilled) * self.rate_limit)
+            self._refilled = now
+            if self._tokens < 1:
+                self.suppressed += count
+                return
+            self._tokens -= 1
+
+        record = {
+            'type': type(e).__name__,
+            'message': str(e),
+            'thread': thread,
+            'time': when,
+            'count': count,
+            'trace': [
+                {
+                    'filename': frame.filename,
+                    'name': frame.name,
+                    'lineno': frame.lineno,
+                    'line': frame.line
+                }
+                for frame in traceback.extract_tb(e.__traceback__)
+            ],
+            'exception': e,
+        }
+        self.delivered += 1
+        for sink in list(self.sinks):
+            try:
+                sink(record)
+            except Exception:
+                self.sink_errors += 1
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Package: signals
+File:    _matching.py
+
+Python Version: 3.10
+
+Type matching for signal typedefs and slot annotations. Annotations are
+normalized once, at signal construction or connection time, into specs: tuples
+of alternative classes. Matching an emitted class against a spec is then an
+MRO lookup, falling back to issubclass() for ABCs and protocols, memoized by
+the caller (each Signal keeps its own memo, so no shared cache pins classes).
+
+"""
+import inspect
+import types
+import typing
+
+# a spec every class matches
+ANY = (object,)
+
+# origin of X | Y unions, which only exist from Python 3.10
+_UnionType = getattr(types, 'UnionType', None)
+
+
+def normalize(annotation) -> tuple:
+    """
+    Reduce a type annotation to a spec, the tuple of classes it accepts.
+
+    Unions and Optional give their alternatives, Literal the classes of its
+    values, parameterized generics their origin (list[int] -> list,
+    typing.Iterable -> collections.abc.Iterable) and TypeVars their bound or
+    constraints. Type arguments are not checked at runtime. Anything that
+    issubclass() cannot test, such as Any, unresolved forward references or
+    protocols without @runtime_checkable, matches every class.
+    """
+    if annotation is None:
+        return (type(None),)
+    if annotation is typing.Any or annotation is inspect.Parameter.empty:
+        return ANY
+    if isinstance(annotation, typing.TypeVar):
+        if annotation.__bound__ is not None:
+            return normalize(annotation.__bound__)
+        if annotation.__constraints__:
+            return _union(annotation.__constraints__)
+        return ANY
+
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union or (origin is not None and origin is _UnionType):
+        return _union(typing.get_args(annotation))
+    if origin is typing.Annotated:
+        return normalize(typing.get_args(annotation)[0])
+    if origin is typing.Literal:
+        return _union(type(v) for v in typing.get_args(annotation))
+    if origin is not None:
+        annotation = origin
+
+    if not isinstance(annotation, type):
+        return ANY
+    try:
+        issubclass(object, annotation)
+    except TypeError:
+        # e.g. a protocol that is not runtime checkable
+        return ANY
+    return (annotation,)
+
+
+def _union(annotations) -> tuple:
+    rtn = []
+    for annotation in annotations:
+        for cls in normalize(annotation):
+            if cls is object:
+                return ANY
+            if cls not in rtn:
+                rtn.append(cls)
+    return tuple(rtn)
+
+
+def distance(cls: type, target: type, memo: dict = None) -> int:
+    """
+    How far target is up cls's MRO: 0 for the class itself, -1 if cls is not a
+    subclass. A virtual subclass (ABC registration, protocol) is as far as object.
+    Results are stored in memo by (cls, target) if given.
+    """
+    if memo is None:
+        return _distance(cls, target)
+    rtn = memo.get((cls, target))
+    if rtn is None:
+        rtn = memo[(cls, target)] = _distance(cls, target)
+    return rtn
+
+
+def _distance(cls: type, target: type) -> int:
+    mro = cls.__mro__
+    try:
+        return mro.index(target)
+    except ValueError:
+        pass
+    try:
+        if issubclass(cls, target):
+            return len(mro) - 1
+    except TypeError:
+        pass
+    return -1
+
+
+def specDistance(given: tuple, spec: tuple, memo: dict = None) -> int:
+    """
+    Distance of every alternative of the given spec to its closest alternative
+    in spec, the largest of those; -1 if some alternative matches none.
+    memo is as for distance().
+    """
+    rtn = 0
+    for cls in given:
+        best = -1
+        for target in spec:
+            d = distance(cls, target, memo)
+            if d >= 0 and (best < 0 or d < best):
+                best = d
+        if best < 0:
+            return -1
+        rtn = max(rtn, best)
+    return rtn
+
+
+def accepts(spec: tuple, cls: type, memo: dict = None) -> bool:
+    """
+    Whether an argument of class cls fits spec. memo is as for distance().
+    """
+    for target in spec:
+        if distance(cls, target, memo) >= 0:
+            return True
+    return False
+
+
+def typeHints(func: typing.Callable) -> dict:
+    """
+    Resolved annotations of func, evaluating string annotations where possible.
+    """
+    try:
+        return typing.get_type_hints(func, include_extras=True)
+    except Exception:
+        return getattr(func, '__annotations__', None) or {}
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Package: signals
+File:    _metrics.py
+
+Python Version: 3.10
+
+Opt-in emission metrics: queue wait and run time histograms per signal and
+per slot, and worker utilization. Enabled through signals.enableMetrics().
+
+"""
+import threading
+import time
+
+# log2 buckets of nanoseconds; bucket i holds durations in [2**(i-1), 2**i)
+_BUCKETS = 64
+
+# records a thread buffers before folding them into its table
+_FOLD_AT = 256
+
+
+class _Stats:
+    """
+    Accumulated timings of one (signal, slot) pair on one thread.
+    """
+    __slots__ = ('count', 'wait_total', 'run_total', 'wait_max', 'run_max',
+                 'wait_buckets', 'run_buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.wait_total = 0
+        self.run_total = 0
+        self.wait_max = 0
+        self.run_max = 0
+        self.wait_buckets = [0] * _BUCKETS
+        self.run_buckets = [0] * _BUCKETS
+
+
+def _accumulate(table: dict, records: list):
+    """
+    Add (key, wait, run) records to the _Stats of a table. Runs of records
+    with the same key are summed in locals, written back once per run.
+    """
+    stats = None
+    last = None
+    for key, wait, run in records:
+        if key is not last:
+            if stats is not None:
+                _store(stats, count, wait_total, run_total, wait_max, run_max)
+            last = key
+            stats = table.get(key)
+            if stats is None:
+                stats = table[key] = _Stats()
+            count = wait_total = run_total = 0
+            wait_max, run_max = stats.wait_max, stats.run_max
+            wait_buckets, run_buckets = stats.wait_buckets, stats.run_buckets
+        count += 1
+        wait_total += wait
+        run_total += run
+        if wait > wait_max:
+            wait_max = wait
+        if run > run_max:
+            run_max = run
+        wait_buckets[wait.bit_length()] += 1
+        run_buckets[run.bit_length()] += 1
+    if stats is not None:
+        _store(stats, count, wait_total, run_total, wait_max, run_max)
+
+
+def _store(stats: _Stats, count: int, wait_total: int, run_total: int,
+           wait_max: int, run_max: int):
+    stats.count += count
+    stats.wait_total += wait_total
+    stats.run_total += run_total
+    stats.wait_max = wait_max
+    stats.run_max = run_max
+
+
+def _add(acc: _Stats, stats: _Stats) -> _Stats:
+    """
+    Add the timings of stats to acc, returning acc.
+    """
+    acc.count += stats.count
+    acc.wait_total += stats.wait_total
+    acc.run_total += stats.run_total
+    acc.wait_max = max(acc.wait_max, stats.wait_max)
+    acc.run_max = max(acc.run_max, stats.run_max)
+    for i in range(_BUCKETS):
+        acc.wait_buckets[i] += stats.wait_buckets[i]
+        acc.run_buckets[i] += stats.run_buckets[i]
+    return acc
+
+
+class _Recorder:
+    """
+    One thread's records: a buffer of (key, wait, run) tuples its thread
+    appends to, and the table of _Stats by key the buffer is folded into.
+    lock keeps a snapshot from reading the two halfway through a fold.
+    """
+    __slots__ = ('thread', 'table', 'buffer', 'lock')
+
+    def __init__(self):
+        self.thread = threading.current_thread()
+        self.table = {}
+        self.buffer = []
+        self.lock = threading.Lock()
+
+    def fold(self):
+        with self.lock:
+            records = self.buffer[:]
+            del self.buffer[:len(records)]
+            _accumulate(self.table, records)
+
+    def copy(self) -> dict:
+        """
+        A copy of the table with the records buffered so far folded in.
+        """
+        with self.lock:
+            records = self.buffer[:]
+            table = {key: _add(_Stats(), stats) for key, stats in self.table.items()}
+        _accumulate(table, records)
+        return table
+
+
+def _summarize(count: int, total: int, peak: int, buckets: list) -> dict:
+    """
+    Summarize a histogram in microseconds. Percentiles are bucket upper bounds,
+    so they overestimate by at most a factor of two.
+    """
+    rtn = {'count': count, 'mean_us': total / count / 1e3 if count else 0.0,
+           'max_us': peak / 1e3}
+    for name, fraction in (('p50_us', 0.5), ('p90_us', 0.9), ('p99_us', 0.99)):
+        target = count * fraction
+        seen = 0
+        value = 0
+        for i, n in enumerate(buckets):
+            seen += n
+            if n and seen >= target:
+                value = min(1 << i, peak)
+                break
+        rtn[name] = value / 1e3
+    return rtn
+
+
+class SignalMetrics:
+    """
+    Collects per-task enqueue, start and end times.
+
+    Every thread records into its own _Recorder, so recording takes no
+    lock; a record only appends to the thread's buffer, which is folded into
+    its table's histograms every _FOLD_AT records. snapshot() merges the
+    recorders, tolerating records made while it runs. The records of
+    threads that have exited, e.g. retired workers, are merged into one
+    table so the recorders do not pile up.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter_ns()
+        self._local = threading.local()
+        self._recorders = []  # one per live recording thread
+        self._retired = {}  # _Stats by key of threads that have exited
+        self._lock = threading.Lock()
+
+    def _register(self) -> list:
+        recorder = _Recorder()
+        self._local.recorder = recorder
+        self._local.buffer = recorder.buffer
+        with self._lock:
+            self._retire()
+            self._recorders.append(recorder)
+        return recorder.buffer
+
+    def _retire(self):
+        # under _lock; an exited thread no longer touches its recorder
+        live = []
+        for recorder in self._recorders:
+            if recorder.thread.is_alive():
+                live.append(recorder)
+                continue
+            for key, stats in recorder.copy().items():
+                _add(self._retired.setdefault(key, _Stats()), stats)
+        self._recorders = live
+
+    def record(self, signal: str, slot: str, enqueued: int, started: int, ended: int):
+        """
+        Record one task; times are time.perf_counter_ns() values.
+        """
+        self.record_key((signal, slot), enqueued, started, ended)
+
+    def record_key(self, key: tuple, enqueued: int, started: int, ended: int):
+        """
+        Record one task under a (signal, slot) key built ahead of time.
+        """
+        try:
+            buffer = self._local.buffer
+        except AttributeError:
+            buffer = self._register()
+        buffer.append((key, started - enqueued, ended - started))
+        if len(buffer) >= _FOLD_AT:
+            self._local.recorder.fold()
+
+    def snapshot(self, queue_depth: dict = None, workers: int = 0) -> dict:
+        """
+        Aggregate everything recorded so far.
+
+        :param queue_depth: dict = None
+            Current number of queued items per priority, included as-is.
+        :param workers: int = 0
+            Current number of worker threads, used for utilization.
+        """
+        with self._lock:
+            self._retire()
+            recorders = list(self._recorders)
+            tables = [{key: _add(_Stats(), stats) for key, stats in self._retired.items()}]
+        elapsed = time.perf_counter_ns() - self.started
+        tables.extend(recorder.copy() for recorder in recorders)
+
+        merged = {'signals': {}, 'slots': {}}
+        busy = 0
+        tasks = 0
+        for table in tables:
+            for (signal, slot), stats in table.items():
+                tasks += stats.count
+                busy += stats.run_total
+                for group, key in (('signals', signal), ('slots', slot)):
+                    _add(merged[group].setdefault(key, _Stats()), stats)
+
+        rtn = {'elapsed_s': elapsed / 1e9, 'tasks': tasks}
+        for group, entries in merged.items():
+            rtn[group] = {
+                key: {
+                    'queue_wait': _summarize(acc.count, acc.wait_total, acc.wait_max,
+                                             acc.wait_buckets),
+                    'run_time': _summarize(acc.count, acc.run_total, acc.run_max,
+                                           acc.run_buckets),
+                }
+                for key, acc in entries.items()
+            }
+        rtn['queue_depth'] = dict(queue_depth or {})
+        rtn['workers'] = {
+            'count': workers,
+            'busy_s': busy / 1e9,
+            'utilization': busy / (elapsed * workers) if workers and elapsed else 0.0,
+        }
+        return rtn
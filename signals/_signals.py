@@ -12,23 +12,31 @@ Revision 1/13/2024 to add signal processor to file, reducing dependency on other
 Revision 7/15/2024 to add bound method decoration ability for SignalFactory class
 
 """
+import asyncio
 import functools
 import inspect
 from typing import Callable, Iterable
-from weakref import WeakSet, WeakMethod, finalize
+from weakref import WeakMethod
 from dataclasses import dataclass, field
-import traceback
-import json
+import os
+import pickle
 import threading
-from concurrent.futures import Future
-from functools import lru_cache
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from collections import OrderedDict, namedtuple
+
+from ._errors import ErrorReporter, LoggingSink, SignalSink
+from ._matching import ANY, accepts, normalize, specDistance, typeHints
+from ._metrics import SignalMetrics
 
 # needed for prioritized worker thread pool
 import sys
 import queue
-import random
+import itertools
 import atexit
+import heapq
 import weakref
+from collections import deque
 from concurrent.futures.thread import ThreadPoolExecutor, _base, _WorkItem
 
 
@@ -45,17 +53,99 @@ Implementation of a ThreadPoolExecutor with PriorityQueue to simplify
 ########################################################################################################################
 
 
-@dataclass(order=True)
 class PriorityWorkItem:
-    priority: int
-    task: _WorkItem = field(compare=False)
+    """
+    Queue entry ordered by (priority, seq); seq is a monotonic submission
+    counter, so items of equal priority run in the order they were submitted.
+    """
+    __slots__ = ('priority', 'seq', 'task')
+
+    # never evicted under OverflowPolicy.DROP_OLDEST
+    pinned = False
+
+    def __init__(self, priority: int, seq: int, task: _WorkItem):
+        self.priority = priority
+        self.seq = seq
+        self.task = task
+
+    def __lt__(self, other: 'PriorityWorkItem') -> bool:
+        if self.priority == other.priority:
+            return self.seq < other.seq
+        return self.priority < other.priority
+
+
+class PostedWorkItem(PriorityWorkItem):
+    """
+    Queue entry for a fire-and-forget call: the function and its arguments are
+    stored on the entry itself, with no Future or _WorkItem behind it.
+    """
+    __slots__ = ('func', 'args', 'pinned')
+
+    def __init__(self, priority: int, seq: int, func: Callable, args: tuple,
+                 pinned: bool = False):
+        self.priority = priority
+        self.seq = seq
+        self.task = None
+        self.func = func
+        self.args = args
+        self.pinned = pinned
+
 
+# submission counter shared by all executors; next() on itertools.count is atomic
+_sequence = itertools.count()
 
 NULL_PRIORITY_ITEM = PriorityWorkItem(
-    priority=sys.maxsize, task=_WorkItem(_base.Future(), lambda: None, args=(), kwargs={}))
+    priority=sys.maxsize, seq=sys.maxsize,
+    task=_WorkItem(_base.Future(), lambda: None, args=(), kwargs={}))
+
+# makes the worker taking it leave a pool that has more workers than it may keep
+RETIRE_PRIORITY_ITEM = PriorityWorkItem(priority=sys.maxsize, seq=sys.maxsize - 1, task=None)
 
 _threads_queues = {}
 
+# marks processor worker threads, used by DispatchMode.AUTO and overflow handling
+_worker_state = threading.local()
+
+# default for arguments to leave unchanged where None is itself a setting
+_KEEP = object()
+
+
+class OverflowPolicy:
+    """
+    What a bounded signal processor does with a submission while its queue is full.
+
+    BLOCK       :: wait for room (workers submitting to their own pool never wait)
+    DROP_NEWEST :: discard the new submission
+    DROP_OLDEST :: discard the oldest item of the least urgent queued priority,
+                   or the new submission if it is less urgent than everything queued
+    RAISE       :: raise queue.Full to the submitter
+    """
+    BLOCK = 'block'
+    DROP_NEWEST = 'drop_newest'
+    DROP_OLDEST = 'drop_oldest'
+    RAISE = 'raise'
+
+    POLICIES = (BLOCK, DROP_NEWEST, DROP_OLDEST, RAISE)
+
+
+def _putUnbounded(work_queue: queue.Queue, item):
+    """
+    Put an item into a queue even if it is at its maxsize, e.g. shutdown sentinels.
+    """
+    with work_queue.mutex:
+        work_queue._put(item)
+        work_queue.unfinished_tasks += 1
+        work_queue.not_empty.notify()
+
+
+def _checkOverflow(overflow: str, queue_type: type):
+    if overflow not in OverflowPolicy.POLICIES:
+        raise ValueError(
+            f"Overflow policy must be one of {OverflowPolicy.POLICIES}, not '{overflow}'")
+    if overflow == OverflowPolicy.DROP_OLDEST and not issubclass(queue_type, _EvictingQueue):
+        raise TypeError(
+            f"'{queue_type.__name__}' does not support OverflowPolicy.DROP_OLDEST")
+
 ########################################################################################################################
 #                                           Before system exit procedure                                               #
 ########################################################################################################################
@@ -67,7 +157,7 @@ def python_exit():
     """
     items = list(_threads_queues.items())
     for t, q in items:
-        q.put(NULL_PRIORITY_ITEM)
+        _putUnbounded(q, NULL_PRIORITY_ITEM)
     for t, q in items:
         t.join()
 
@@ -82,37 +172,328 @@ atexit.register(python_exit)
 ########################################################################################################################
 
 
-def _worker(executor_reference, work_queue):
+def _worker(executor_reference, work_queue, idle_timeout=None, last_take=None, idle=None,
+            lock=None, counted=False):
     """
     Worker
     :param executor_reference: executor function
     :type executor_reference: callable
     :param work_queue: work queue
     :type work_queue: queue.PriorityQueue
+    :param idle_timeout: one-item list holding the seconds without work after which
+        the worker may retire, None for never
+    :type idle_timeout: list
+    :param last_take: one-item list the worker stores the time it last took an item in
+    :type last_take: list
+    :param idle: [idle workers, queued items they are counted on for], see _adjust_thread_count
+    :type idle: list
+    :param lock: lock guarding idle, the executor's _pool_lock
+    :type lock: threading.Lock
+    :param counted: whether the worker starts out counted in idle
+    :type counted: bool
     """
+    _worker_state.active = True
+    _worker_state.queue = work_queue
+    _worker_state.owner = executor_reference
     try:
         while True:
-            work_item = work_queue.get(block=True)
-            if work_item is NULL_PRIORITY_ITEM:
-                break
-            if (isinstance(work_item, PriorityWorkItem)
-                    and work_item.priority != sys.maxsize):
-                work_item = work_item.task
+            try:
+                work_item = work_queue.get(block=False)
+            except queue.Empty:
+                # count the worker idle only while it blocks, so bursts take no lock
+                if idle is not None and not counted:
+                    with lock:
+                        idle[0] += 1
+                    counted = True
                 try:
-                    work_item.run()
-                except Exception as e:
-                    print(e)
-                    raise e
-                del work_item
-                continue
-            executor = executor_reference()
-            if executor is None or executor._shutdown:
-                break
-            del executor
+                    work_item = work_queue.get(block=True, timeout=idle_timeout[0])
+                except queue.Empty:
+                    executor = executor_reference()
+                    if executor is None or executor._retire(executor._min_workers):
+                        break
+                    del executor
+                    continue
+            if counted or (idle is not None and idle[1]):
+                # whichever worker takes an item meets a submission's count on an idle one
+                with lock:
+                    if counted:
+                        idle[0] -= 1
+                    if idle[1]:
+                        idle[1] -= 1
+                counted = False
+            if last_take is not None:
+                last_take[0] = time.monotonic()
+            try:
+                if work_item is NULL_PRIORITY_ITEM:
+                    break
+                if work_item is RETIRE_PRIORITY_ITEM:
+                    executor = executor_reference()
+                    if executor is None or executor._retire(executor._max_workers, idle=False):
+                        break
+                    del executor
+                    continue
+                if type(work_item) is PostedWorkItem:
+                    try:
+                        work_item.func(*work_item.args)
+                    except Exception as e:
+                        _reportException(e)
+                    del work_item
+                    continue
+                if (isinstance(work_item, PriorityWorkItem)
+                        and work_item.priority != sys.maxsize):
+                    work_item = work_item.task
+                    try:
+                        work_item.run()
+                    except Exception as e:
+                        print(e)
+                        raise e
+                    del work_item
+                    continue
+                executor = executor_reference()
+                if executor is None or executor._shutdown:
+                    break
+                del executor
+            finally:
+                # every item taken off the queue is accounted for, so join() works
+                work_queue.task_done()
     except BaseException:
         _base.LOGGER.critical('Exception in worker', exc_info=True)
 
 
+########################################################################################################################
+#                                               Priority work queues                                                   #
+########################################################################################################################
+
+
+class _EvictingQueue:
+    """
+    Mixin for priority work queues supporting OverflowPolicy.DROP_OLDEST.
+
+    Subclasses implement _peek_lowest() and _pop_lowest(), returning the
+    oldest item of the least urgent priority currently queued.
+    """
+
+    def put_evicting(self, item):
+        """
+        Put item without blocking, evicting the oldest least urgent item if full.
+
+        Returns the dropped item: the evicted one, item itself if it is the
+        least urgent, or None if nothing had to be dropped.
+        """
+        with self.mutex:
+            if 0 < self.maxsize <= self._qsize():
+                victim = self._peek_lowest()
+                if (victim.priority < item.priority or victim.priority == sys.maxsize
+                        or victim.pinned):
+                    # never evict something more urgent, a shutdown sentinel or a pinned item
+                    return item
+                self._pop_lowest()
+                self._put(item)
+                self.not_empty.notify()
+                return victim
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+            return None
+
+
+class PriorityHeapQueue(_EvictingQueue, queue.PriorityQueue):
+    """
+    Heap-ordered work queue. Eviction under DROP_OLDEST is O(n).
+    """
+
+    def depths(self) -> dict:
+        """
+        Number of queued items per priority.
+        """
+        with self.mutex:
+            priorities = [item.priority for item in self.queue]
+        rtn = {}
+        for priority in priorities:
+            rtn[priority] = rtn.get(priority, 0) + 1
+        return rtn
+
+    def _peek_lowest(self):
+        return max(self.queue, key=lambda w: (w.priority, -w.seq))
+
+    def _pop_lowest(self):
+        victim = self._peek_lowest()
+        self.queue.remove(victim)
+        heapq.heapify(self.queue)
+        return victim
+
+
+class PriorityLevelQueue(_EvictingQueue, queue.Queue):
+    """
+    Work queue holding one FIFO deque per SignalPriority level.
+
+    A bitmap of non-empty levels locates the most urgent item, so put and get
+    are O(1) regardless of queue depth and items of equal priority leave in
+    the order they arrived. Priorities below IMMEDIATE share the first level;
+    priorities above NONE (including the shutdown sentinel) share the last.
+    """
+
+    def _init(self, maxsize):
+        self._levels = tuple(deque() for _ in range(SignalPriority.NONE + 2))
+        self._last = len(self._levels) - 1
+        self._bitmap = 0
+        self._size = 0
+
+    def _qsize(self):
+        return self._size
+
+    def _level(self, priority: int) -> int:
+        if priority <= 0:
+            return 0
+        return priority if priority < self._last else self._last
+
+    def _put(self, item):
+        level = self._level(item.priority)
+        self._levels[level].append(item)
+        self._bitmap |= 1 << level
+        self._size += 1
+
+    def _get(self):
+        # isolate the lowest set bit: the most urgent non-empty level
+        level = (self._bitmap & -self._bitmap).bit_length() - 1
+        items = self._levels[level]
+        item = items.popleft()
+        if not items:
+            self._bitmap &= ~(1 << level)
+        self._size -= 1
+        return item
+
+    def depths(self) -> dict:
+        """
+        Number of queued items per priority level.
+        """
+        with self.mutex:
+            return {level: len(items) for level, items in enumerate(self._levels) if items}
+
+    def _peek_lowest(self):
+        # the highest set bit is the least urgent non-empty level
+        return self._levels[self._bitmap.bit_length() - 1][0]
+
+    def _pop_lowest(self):
+        level = self._bitmap.bit_length() - 1
+        items = self._levels[level]
+        item = items.popleft()
+        if not items:
+            self._bitmap &= ~(1 << level)
+        self._size -= 1
+        return item
+
+
+class WorkStealingQueue(_EvictingQueue, queue.Queue):
+    """
+    Work queue holding one heap per worker besides a shared one.
+
+    Items put by a worker of the pool (cascading emissions made from inside
+    slots) go to that worker's own heap and are usually run by it, while its
+    arguments are still hot; items put from elsewhere go to the shared heap.
+    A worker runs items from its own heap as long as nothing of a more
+    urgent SignalPriority level is queued anywhere in the pool, then from the
+    shared heap, and otherwise steals from another worker's heap. Per-level
+    counts make that check O(1), so SignalPriority holds across the pool;
+    submission order only holds within each heap. The stolen attribute
+    counts items run by another worker than the one that queued them.
+    """
+
+    def _init(self, maxsize):
+        self._shared = []
+        self._locals = {}  # worker thread ident -> heap
+        self._counts = [0] * (SignalPriority.NONE + 2)
+        self._last = len(self._counts) - 1
+        self._bitmap = 0
+        self._size = 0
+        self.stolen = 0
+
+    def _qsize(self):
+        return self._size
+
+    def _level(self, priority: int) -> int:
+        if priority <= 0:
+            return 0
+        return priority if priority < self._last else self._last
+
+    def _put(self, item):
+        if getattr(_worker_state, 'queue', None) is self:
+            ident = threading.get_ident()
+            heap = self._locals.get(ident)
+            if heap is None:
+                heap = self._locals[ident] = []
+        else:
+            heap = self._shared
+        heapq.heappush(heap, item)
+        level = item.priority
+        if not 0 < level < self._last:
+            level = self._level(level)
+        self._counts[level] += 1
+        self._bitmap |= 1 << level
+        self._size += 1
+
+    def _get(self):
+        # the lowest set bit is the most urgent level queued anywhere
+        urgent = (self._bitmap & -self._bitmap).bit_length() - 1
+        ident = threading.get_ident()
+        own = self._locals.get(ident)
+        if own and (own[0].priority == urgent or self._level(own[0].priority) == urgent):
+            return self._take(own, ident)
+        shared = self._shared
+        if shared and self._level(shared[0].priority) == urgent:
+            return self._take(shared, None)
+        for owner, heap in self._locals.items():
+            if heap and self._level(heap[0].priority) == urgent:
+                self.stolen += 1
+                return self._take(heap, owner)
+        raise RuntimeError('work queue counts out of step with its heaps')
+
+    def _take(self, heap: list, owner: int):
+        item = heapq.heappop(heap)
+        if not heap and owner is not None:
+            # workers come and go; only keep heaps holding items
+            del self._locals[owner]
+        self._remove(item)
+        return item
+
+    def _remove(self, item):
+        level = item.priority
+        if not 0 < level < self._last:
+            level = self._level(level)
+        self._counts[level] -= 1
+        if not self._counts[level]:
+            self._bitmap &= ~(1 << level)
+        self._size -= 1
+
+    def _heaps(self):
+        return [self._shared, *self._locals.values()]
+
+    def depths(self) -> dict:
+        """
+        Number of queued items per priority.
+        """
+        with self.mutex:
+            priorities = [item.priority for heap in self._heaps() for item in heap]
+        rtn = {}
+        for priority in priorities:
+            rtn[priority] = rtn.get(priority, 0) + 1
+        return rtn
+
+    def _peek_lowest(self):
+        return max((item for heap in self._heaps() for item in heap),
+                   key=lambda w: (w.priority, -w.seq))
+
+    def _pop_lowest(self):
+        victim = self._peek_lowest()
+        for heap in self._heaps():
+            if victim in heap:
+                heap.remove(victim)
+                heapq.heapify(heap)
+                break
+        self._remove(victim)
+        return victim
+
+
 ########################################################################################################################
 #                           Little hack of ThreadPoolExecutor from concurrent.futures.thread                           #
 ########################################################################################################################
@@ -120,23 +501,62 @@ def _worker(executor_reference, work_queue):
 
 class PriorityThreadPoolExecutor(ThreadPoolExecutor):
     """
-    Thread pool executor with priority queue (priorities must be different, lowest first)
+    Thread pool executor with priority queue (lowest priority first, FIFO within a priority)
     """
     _work_queue: queue.PriorityQueue
 
-    def __init__(self, **kwargs):
+    def __init__(self, queue_type: type = PriorityHeapQueue, max_queue: int = 0,
+                 overflow: str = OverflowPolicy.BLOCK, min_workers: int = 0,
+                 idle_timeout: float = None, scale_up_depth: int = 1,
+                 scale_up_wait: float = None, **kwargs):
         """
         Initializes a new PriorityThreadPoolExecutor instance
+        :param queue_type: work queue class; PriorityHeapQueue, PriorityLevelQueue or WorkStealingQueue
+        :type queue_type: type
+        :param max_queue: maximum number of queued work items, 0 for unbounded
+        :type max_queue: int
+        :param overflow: OverflowPolicy applied to submissions while the queue is full
+        :type overflow: str
+        :param min_workers: number of workers kept alive however idle, started on demand
+        :type min_workers: int
+        :param idle_timeout: seconds a worker above min_workers may idle before it retires, None for never
+        :type idle_timeout: float
+        :param scale_up_depth: queued items at which a submission starts another worker
+        :type scale_up_depth: int
+        :param scale_up_wait: seconds without any worker taking an item after which a
+            submission to a non-empty queue starts another worker, None to disable
+        :type scale_up_wait: float
         :param max_workers: the maximum number of threads that can be used to execute the given calls
         :type max_workers: int
         """
+        _checkOverflow(overflow, queue_type)
         super(PriorityThreadPoolExecutor, self).__init__(**kwargs)
 
-        # change work queue type to queue.PriorityQueue
+        # change work queue type to the requested priority-ordered queue
 
-        self._work_queue = queue.PriorityQueue()
+        self._work_queue = queue_type(max_queue)
+        self._overflow = overflow
         self._shutdown = False
 
+        # backpressure counters
+        self._stats_lock = threading.Lock()
+        self.dropped = 0
+        self.blocked = 0
+
+        # autoscaling; _pool_lock guards _threads against workers retiring themselves,
+        # and _idle_workers: workers blocked waiting for an item (or starting), and
+        # how many of them submissions already count on to take an item queued
+        self._pool_lock = threading.Lock()
+        self._idle_workers = [0, 0]
+        self._thread_ids = itertools.count(1)
+        self._idle_timeout = [idle_timeout]  # read by workers each time they wait
+        self._scale_up_depth = scale_up_depth
+        self._scale_up_wait = scale_up_wait
+        # always tracked, so resize() can enable scale_up_wait on running workers
+        self._last_take = [time.monotonic()]
+        self._min_workers = 0
+        self.resize(self._max_workers, min_workers)
+
     # ------------------------------------------------------------------------------------------------------------------
 
     def submit(self, fn, *args, **kwargs) -> Future:
@@ -149,43 +569,312 @@ class PriorityThreadPoolExecutor(ThreadPoolExecutor):
         :return: future instance
         :rtype: _base.Future
         Added keyword:
-        - priority (integer later sys.maxsize)
+        - priority (integer lower than sys.maxsize, default SignalPriority.NORMAL)
         """
         with self._shutdown_lock:
             if self._shutdown:
                 raise RuntimeError(
                     'cannot schedule new futures after shutdown')
 
-            priority = kwargs.pop('priority', random.randint(0, sys.maxsize-1))
+            priority = kwargs.pop('priority', SignalPriority.NORMAL)
 
             f = _base.Future()
             w = _WorkItem(f, fn, args, kwargs)
+            item = PriorityWorkItem(priority, next(_sequence), w)
+
+            queued = self._enqueue(item)
+            if queued is not None:
+                if queued:
+                    self._adjust_thread_count()
+                else:
+                    f.cancel()
+                return f
+        # wait for room without holding the shutdown lock, which workers need to emit
+        self._blockingPut(item)
+        self._adjust_thread_count()
+        return f
 
-            self._work_queue.put(PriorityWorkItem(
-                priority=priority,
-                task=w
-            ))
-            self._adjust_thread_count()
-            return f
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def post(self, fn, *args, priority: int = None, bounded: bool = True) -> bool:
+        """
+        Queue fn(*args) without creating a Future for it
+        :param fn: function being executed
+        :type fn: callable
+        :param args: function's positional arguments
+        :param priority: integer lower than sys.maxsize, None for SignalPriority.NORMAL
+        :type priority: int
+        :param bounded: False to queue the call past max_queue, exempt from the
+            overflow policy and from eviction, for calls that must not be lost
+        :type bounded: bool
+        :return: False if the overflow policy dropped the call
+        :rtype: bool
+        Exceptions raised by fn are reported on the worker thread.
+        """
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError(
+                    'cannot schedule new futures after shutdown')
+
+            if priority is None:
+                priority = SignalPriority.NORMAL
+            if not bounded:
+                _putUnbounded(self._work_queue,
+                              PostedWorkItem(priority, next(_sequence), fn, args, pinned=True))
+                self._adjust_thread_count()
+                return True
+            item = PostedWorkItem(priority, next(_sequence), fn, args)
+            posted = self._enqueue(item)
+            if posted is not None:
+                if posted:
+                    self._adjust_thread_count()
+                return posted
+        self._blockingPut(item)
+        self._adjust_thread_count()
+        return True
+
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _enqueue(self, item: PriorityWorkItem) -> bool:
+        """
+        Put a work item on the queue according to the overflow policy.
+        Returns False if the item itself was dropped, None if the queue is
+        full under OverflowPolicy.BLOCK and the caller has to _blockingPut it.
+        """
+        work_queue = self._work_queue
+        if work_queue.maxsize <= 0:
+            work_queue.put(item)
+            return True
+        try:
+            work_queue.put(item, block=False)
+            return True
+        except queue.Full:
+            pass
+
+        if self._overflow == OverflowPolicy.BLOCK:
+            if getattr(_worker_state, 'queue', None) is work_queue:
+                # a worker waiting on its own full queue could deadlock the pool
+                _putUnbounded(work_queue, item)
+                return True
+            with self._stats_lock:
+                self.blocked += 1
+            return None
+
+        with self._stats_lock:
+            self.dropped += 1
+        if self._overflow == OverflowPolicy.RAISE:
+            raise queue.Full(
+                f'signal processor queue is full ({work_queue.maxsize} items)')
+        if self._overflow == OverflowPolicy.DROP_OLDEST:
+            victim = work_queue.put_evicting(item)
+            if victim is None:
+                # room became available in the meantime
+                with self._stats_lock:
+                    self.dropped -= 1
+                return True
+            if victim is not item:
+                if victim.task is not None:
+                    victim.task.future.cancel()
+                return True
+        return False
+
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _blockingPut(self, item: PriorityWorkItem):
+        """
+        Put a work item once the queue has room, raising RuntimeError if the
+        pool shuts down meanwhile. Called without holding _shutdown_lock.
+        """
+        work_queue = self._work_queue
+        with work_queue.not_full:
+            while True:
+                if self._shutdown:
+                    raise RuntimeError('cannot schedule new futures after shutdown')
+                if work_queue.maxsize <= 0 or work_queue._qsize() < work_queue.maxsize:
+                    break
+                work_queue.not_full.wait()
+            work_queue._put(item)
+            work_queue.unfinished_tasks += 1
+            work_queue.not_empty.notify()
 
     # ------------------------------------------------------------------------------------------------------------------
 
     def _adjust_thread_count(self):
         """
-        Attempt to start a new thread
+        Called once per item queued: count on an idle worker for it if one is
+        free; else start a worker if there are fewer than min_workers or none
+        at all, or, below max_workers, if the items no worker is counted on
+        reach scale_up_depth or the queue has stalled
         """
+        with self._pool_lock:
+            idle = self._idle_workers
+            if idle[0] > idle[1]:
+                idle[1] += 1
+                return
+            n = len(self._threads)
+            if n >= self._max_workers:
+                return
+            # the thresholds only apply once a worker is running to take the item
+            if n and n >= self._min_workers:
+                # at least the item just queued; the count lags while a worker takes one
+                backlog = max(self._work_queue.qsize() - idle[1], 1)
+                stalled = (self._scale_up_wait is not None
+                           and time.monotonic() - self._last_take[0] >= self._scale_up_wait)
+                if backlog < self._scale_up_depth and not stalled:
+                    return
+            self._start_worker()
+            idle[1] += 1
+
+    def _start_worker(self):
         def weak_ref_cb(_, q=self._work_queue):
             pass
-        if len(self._threads) < self._max_workers:
-            t = threading.Thread(
-                target=_worker,
-                args=(weakref.ref(self, weak_ref_cb), self._work_queue),
-                name=f"{self._thread_name_prefix}_{len(self._threads)+1}"
-            )
-            t.daemon = True
-            t.start()
-            self._threads.add(t)
-            _threads_queues[t] = self._work_queue
+        # a starting worker counts as idle until it takes its first item
+        self._idle_workers[0] += 1
+        t = threading.Thread(
+            target=_worker,
+            args=(weakref.ref(self, weak_ref_cb), self._work_queue,
+                  self._idle_timeout, self._last_take, self._idle_workers,
+                  self._pool_lock, True),
+            name=f"{self._thread_name_prefix}_{next(self._thread_ids)}"
+        )
+        t.daemon = True
+        t.start()
+        self._threads.add(t)
+        _threads_queues[t] = self._work_queue
+
+    def _retire(self, keep: int, idle: bool = True) -> bool:
+        """
+        Called by a worker: remove the calling thread from the pool if the pool
+        has more than keep workers (and, if idle, nothing is queued).
+        Returns True if removed.
+
+        An idle worker a submission counts on stays; otherwise it leaves the
+        idle count as it retires, under the same _pool_lock.
+        """
+        with self._pool_lock:
+            if self._shutdown or len(self._threads) <= keep:
+                return False
+            if idle:
+                idle_workers = self._idle_workers
+                if self._work_queue.qsize() or idle_workers[0] <= idle_workers[1]:
+                    return False
+                idle_workers[0] -= 1
+            t = threading.current_thread()
+            self._threads.discard(t)
+            _threads_queues.pop(t, None)
+            return True
+
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def bound(self, max_queue: int = None, overflow: str = None):
+        """
+        Change the queue bound and overflow policy at runtime
+        :param max_queue: new maximum number of queued work items, 0 for unbounded, None to keep it
+        :type max_queue: int
+        :param overflow: new OverflowPolicy, None to keep it
+        :type overflow: str
+        Items queued beyond a lowered bound stay queued; submissions blocked
+        on a raised or removed bound resume.
+        """
+        work_queue = self._work_queue
+        if overflow is not None:
+            _checkOverflow(overflow, type(work_queue))
+        if max_queue is not None and max_queue < 0:
+            raise ValueError('max_queue must not be negative')
+        with work_queue.mutex:
+            if overflow is not None:
+                self._overflow = overflow
+            if max_queue is not None:
+                work_queue.maxsize = max_queue
+                work_queue.not_full.notify_all()
+
+    def resize(self, max_workers: int = None, min_workers: int = None,
+               scale_up_depth: int = None, scale_up_wait: float = _KEEP,
+               idle_timeout: float = _KEEP):
+        """
+        Change the pool's capacity and scale-up thresholds at runtime
+        :param max_workers: new maximum number of workers, None to keep it
+        :type max_workers: int
+        :param min_workers: new number of workers kept alive, None to keep it
+        :type min_workers: int
+        :param scale_up_depth: new queued items at which a submission starts another worker, None to keep it
+        :type scale_up_depth: int
+        :param scale_up_wait: new stall time starting another worker, None to disable; keeps it if omitted
+        :type scale_up_wait: float
+        :param idle_timeout: new idle time retiring a worker, None for never; keeps it if omitted
+        :type idle_timeout: float
+        Workers beyond a lowered maximum retire once they have finished the
+        work queued before them; workers up to a raised minimum start at once.
+        """
+        with self._pool_lock:
+            max_workers = self._max_workers if max_workers is None else max_workers
+            min_workers = self._min_workers if min_workers is None else min_workers
+            if max_workers <= 0:
+                raise ValueError('max_workers must be greater than 0')
+            if not 0 <= min_workers <= max_workers:
+                raise ValueError('min_workers must be between 0 and max_workers')
+            if scale_up_depth is not None and scale_up_depth < 1:
+                raise ValueError('scale_up_depth must be at least 1')
+            self._max_workers = max_workers
+            self._min_workers = min_workers
+            if scale_up_depth is not None:
+                self._scale_up_depth = scale_up_depth
+            if scale_up_wait is not _KEEP:
+                self._scale_up_wait = scale_up_wait
+            if idle_timeout is not _KEEP:
+                # workers already waiting pick it up once they next wait
+                self._idle_timeout[0] = idle_timeout
+            for _ in range(len(self._threads) - max_workers):
+                _putUnbounded(self._work_queue, RETIRE_PRIORITY_ITEM)
+            self._prestart(min_workers)
+
+    def prestart(self, count: int = None) -> int:
+        """
+        Start idle workers ahead of demand, so the first emissions do not wait
+        for threads to start
+        :param count: number of workers the pool should have, None for max_workers
+        :type count: int
+        :return: number of workers started
+        :rtype: int
+        Workers started beyond min_workers retire after idle_timeout like any other.
+        """
+        with self._pool_lock:
+            return self._prestart(self._max_workers if count is None
+                                  else min(count, self._max_workers))
+
+    def _prestart(self, count: int) -> int:
+        started = max(count - len(self._threads), 0)
+        for _ in range(started):
+            self._start_worker()
+        return started
+
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def stats(self) -> dict:
+        """
+        Current worker count, scale-up thresholds, queued items (in total and
+        per priority) and backpressure counters
+        """
+        return {
+            'workers': len(self._threads),
+            'min_workers': self._min_workers,
+            'max_workers': self._max_workers,
+            'scale_up_depth': self._scale_up_depth,
+            'scale_up_wait': self._scale_up_wait,
+            'queued': self._work_queue.qsize(),
+            'queue_depth': (self._work_queue.depths()
+                            if hasattr(self._work_queue, 'depths') else {}),
+            'dropped': self.dropped,
+            'blocked': self.blocked,
+        }
+
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def join(self):
+        """
+        Wait for all queued work items to be processed
+        """
+        self._work_queue.join()
 
     # ------------------------------------------------------------------------------------------------------------------
 
@@ -195,12 +884,16 @@ class PriorityThreadPoolExecutor(ThreadPoolExecutor):
         :param wait: if True wait for all threads to complete
         :type wait: bool
         """
-        with self._shutdown_lock:
+        with self._shutdown_lock, self._pool_lock:
             self._shutdown = True
-        for _ in self._threads:
-            self._work_queue.put(NULL_PRIORITY_ITEM)
+            threads = list(self._threads)
+        # wake emitters blocked on a full queue; they raise RuntimeError
+        with self._work_queue.not_full:
+            self._work_queue.not_full.notify_all()
+        for _ in threads:
+            _putUnbounded(self._work_queue, NULL_PRIORITY_ITEM)
         if wait:
-            for t in self._threads:
+            for t in threads:
                 t.join()
 
 
@@ -222,23 +915,441 @@ class SignalPriority:
     NONE = 6
 
 
+class DispatchMode:
+    """
+    How a slot is invoked when its signal emits, modeled on Qt connection types.
+
+    DIRECT  :: call the slot on the emitting thread before emit() returns
+    QUEUED  :: submit the slot to the signal processor thread pool
+    AUTO    :: DIRECT when emitting from a signal processor worker, else QUEUED
+    PROCESS :: submit the slot to the process pool from getProcessProcessor();
+               the slot and emitted arguments must be picklable
+    """
+    DIRECT = 'direct'
+    QUEUED = 'queued'
+    AUTO = 'auto'
+    PROCESS = 'process'
+
+    MODES = (DIRECT, QUEUED, AUTO, PROCESS)
+
+
+def _checkDispatchMode(mode: str):
+    if mode not in DispatchMode.MODES:
+        raise ValueError(
+            f"Dispatch mode must be one of {DispatchMode.MODES}, not '{mode}'")
+
+
+SimilarityCacheInfo = namedtuple(
+    'SimilarityCacheInfo', ['hits', 'misses', 'maxsize', 'currsize', 'policy'])
+
+
+class _SimilarityCache:
+    """
+    Bounded typedef-match cache owned by a single Signal.
+
+    Evicts the least recently used ('lru') or least frequently used ('lfu')
+    entry once maxsize is reached; a maxsize of None never evicts.
+    """
+    POLICIES = ('lru', 'lfu')
+
+    def __init__(self, maxsize: int = 128, policy: str = 'lru'):
+        if policy not in self.POLICIES:
+            raise ValueError(
+                f"Cache policy must be one of {self.POLICIES}, not '{policy}'")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._uses = {}  # key -> hit count, only maintained for 'lfu'
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if self.policy == 'lru':
+                self._data.move_to_end(key)
+            else:
+                self._uses[key] += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            if key not in self._data and self.maxsize is not None:
+                if self.maxsize <= 0:
+                    return
+                if len(self._data) >= self.maxsize:
+                    if self.policy == 'lru':
+                        victim = next(iter(self._data))
+                    else:
+                        # ties resolve to the oldest entry
+                        victim = min(self._uses, key=self._uses.__getitem__)
+                        del self._uses[victim]
+                    del self._data[victim]
+            self._data[key] = value
+            if self.policy == 'lfu':
+                self._uses.setdefault(key, 0)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._uses.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> SimilarityCacheInfo:
+        return SimilarityCacheInfo(
+            self.hits, self.misses, self.maxsize, len(self._data), self.policy)
+
+
+class _PendingEmission:
+    """
+    Latest not-yet-started emission of one connection of a coalescing signal.
+
+    args is None while nothing is pending; posted is True once a work item that
+    will consume args has been queued on the processor.
+    """
+    __slots__ = ('signal', 'connection', 'args', 'kwargs', 'posted', 'deadline', 'last_run')
+
+    def __init__(self, signal: 'Signal', connection: 'Connection'):
+        self.signal = signal
+        self.connection = connection
+        self.args = None
+        self.kwargs = None
+        self.posted = False
+        self.deadline = 0.0
+        self.last_run = float('-inf')
+
+
+# messages a serial connection's mailbox runs per work item before yielding the worker
+MAILBOX_BATCH = 32
+
+
+class _Mailbox:
+    """
+    Messages waiting for one serial connection.
+
+    scheduled is True while a work item that drains the mailbox is queued or
+    running, so at most one invocation of the slot runs at a time. Messages
+    are (func, args, kwargs, future) tuples; func None stands for the slot.
+    """
+    __slots__ = ('connection', 'messages', 'scheduled', 'lock')
+
+    def __init__(self, connection: 'Connection'):
+        self.connection = connection
+        self.messages = deque()
+        self.scheduled = False
+        self.lock = threading.Lock()
+
+    def push(self, message: tuple):
+        self.messages.append(message)
+        with self.lock:
+            if self.scheduled:
+                return
+            self.scheduled = True
+        self.post()
+
+    def post(self):
+        signal = self.connection.signal
+        if signal is None:
+            return
+        try:
+            signal._postMailbox(self)
+        except BaseException:
+            # e.g. the processor was shut down; the next message schedules again
+            with self.lock:
+                self.scheduled = False
+            raise
+
+
+def _deadRef():
+    # stands in for the weak reference of a removed connection
+    return None
+
+
+def _slotKey(slot: Callable):
+    """
+    Registry key of a slot: its id, or for a bound method the ids of its
+    instance and function, so the same method of many instances never collide.
+    A key is released by the weakref callback before its ids can be reused.
+    """
+    if inspect.ismethod(slot):
+        return id(slot.__self__), id(slot.__func__)
+    return id(slot)
+
+
+def _acceptsKeywords(connection: 'Connection', arity: int, kwtypes: tuple,
+                     memo: dict = None) -> bool:
+    """
+    Whether a connection's slot can be called with arity positional arguments
+    plus the given (name, type) keyword arguments, each type fitting the
+    annotation of the parameter it binds to.
+    """
+    sig = connection.signature
+    try:
+        sig.bind(*range(arity), **{name: None for name, _ in kwtypes})
+    except TypeError:
+        return False
+    var_keyword = next(
+        (p for p in sig.parameters.values() if p.kind is inspect.Parameter.VAR_KEYWORD), None)
+    for name, value_type in kwtypes:
+        param = sig.parameters.get(name)
+        if param is None or param.kind not in (inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                               inspect.Parameter.KEYWORD_ONLY):
+            param = var_keyword
+        if not accepts(_paramSpec(connection.hints, param), value_type, memo):
+            return False
+    return True
+
+
+def _paramSpec(hints: dict, param: inspect.Parameter) -> tuple:
+    """
+    Normalized annotation of a slot parameter, preferring resolved type hints.
+    """
+    return normalize(hints.get(param.name, param.annotation))
+
+
+def _fits(connection: 'Connection', types: tuple, memo: dict = None) -> bool:
+    """
+    Whether emitted argument types fit the annotations of a connection's slot.
+    memo caches class distances, see _matching.distance.
+    """
+    specs = connection.specs
+    for i, cls in enumerate(types):
+        spec = specs[i] if i < len(specs) else connection.rest_spec
+        if spec is not ANY and not accepts(spec, cls, memo):
+            return False
+    return True
+
+
+def _slotDied(signal_ref: weakref.ref, key, _):
+    signal = signal_ref()
+    if signal is not None:
+        signal._discard(key)
+
+
+class Connection:
+    """
+    A slot connected to a signal, as returned by Signal.connect.
+
+    The slot is held weakly, bound methods through a WeakMethod, so connecting
+    does not keep the slot or its instance alive; when it is collected the
+    connection removes itself from the signal. Used as a context manager, the
+    connection is disconnected on exit.
+    """
+    __slots__ = ('ref', 'typedefs', 'signature', 'hints', 'specs', 'rest_spec',
+                 'required_keywords', 'mode', 'pending', 'mailbox', 'lanes', '_key', '_signal')
+
+    def __init__(self, signal: 'Signal', slot: Callable, typedefs: tuple,
+                 signature: inspect.Signature, hints: dict, mode: str, key,
+                 serial: bool = False):
+        self._signal = weakref.ref(signal)
+        callback = functools.partial(_slotDied, self._signal, key)
+        if inspect.ismethod(slot):
+            self.ref = WeakMethod(slot, callback)
+        else:
+            self.ref = weakref.ref(slot, callback)
+        self.typedefs = typedefs  # one per number of positional arguments the slot accepts
+        self.signature = signature
+        self.hints = hints
+        # normalized annotations of positional parameters, and of *args
+        params = signature.parameters.values()
+        self.specs = tuple(_paramSpec(hints, p) for p in params
+                           if p.kind in (inspect.Parameter.POSITIONAL_ONLY,
+                                         inspect.Parameter.POSITIONAL_OR_KEYWORD))
+        self.rest_spec = next((_paramSpec(hints, p) for p in params
+                               if p.kind is inspect.Parameter.VAR_POSITIONAL), ANY)
+        # keyword-only parameters without default; only keyword emissions can reach the slot
+        self.required_keywords = tuple(
+            p.name for p in signature.parameters.values()
+            if p.kind is inspect.Parameter.KEYWORD_ONLY and p.default is p.empty)
+        self.mode = mode  # None for the signal's default dispatch mode
+        self.pending = None  # _PendingEmission of a coalescing signal
+        self.mailbox = _Mailbox(self) if serial else None
+        # mailboxes of a keyed signal's lanes by lane, created on first use
+        self.lanes = {} if signal.key is not None else None
+        self._key = key
+
+    def lane(self, index: int) -> '_Mailbox':
+        """
+        The mailbox of a keyed signal's lane, created on first use.
+        """
+        mailbox = self.lanes.get(index)
+        if mailbox is None:
+            # setdefault: concurrent first emissions on a lane share one mailbox
+            mailbox = self.lanes.setdefault(index, _Mailbox(self))
+        return mailbox
+
+    @property
+    def signal(self) -> 'Signal':
+        """
+        The signal, or None if it was garbage collected.
+        """
+        return self._signal()
+
+    @property
+    def slot(self) -> Callable:
+        """
+        The connected slot, or None once disconnected or garbage collected.
+        """
+        return self.ref()
+
+    @property
+    def connected(self) -> bool:
+        return self.ref() is not None
+
+    @property
+    def serial(self) -> bool:
+        """
+        Whether the slot runs one emission at a time, see Signal.connect.
+        """
+        return self.mailbox is not None
+
+    def disconnect(self) -> None:
+        """
+        Disconnect the slot from the signal. Does nothing if already disconnected.
+        """
+        signal = self._signal()
+        if signal is not None:
+            signal._discard(self._key, self)
+        self.ref = _deadRef
+
+    def __enter__(self) -> 'Connection':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disconnect()
+
+    def __repr__(self) -> str:
+        slot = self.ref()
+        signal = self._signal()
+        target = getattr(slot, '__qualname__', slot) if slot is not None else 'disconnected'
+        return f'<Connection {signal.name if signal is not None else None} -> {target}>'
+
+
+class ConnectionGroup:
+    """
+    Collects connections, possibly to many signals, to disconnect them together.
+
+    Used as a context manager, every connection in the group is disconnected on exit.
+    """
+
+    def __init__(self, connections: Iterable[Connection] = ()):
+        self._connections = list(connections)
+
+    def add(self, connection: Connection) -> Connection:
+        """
+        Add a connection to the group and return it.
+        """
+        self._connections.append(connection)
+        return connection
+
+    def connect(self, signal: 'Signal', slot: Callable, dispatch: str = None,
+                serial: bool = False) -> Connection:
+        """
+        Connect slot to signal and add the connection to the group.
+        """
+        return self.add(signal.connect(slot, dispatch, serial))
+
+    def disconnect(self) -> None:
+        """
+        Disconnect every connection in the group and empty it.
+        """
+        connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.disconnect()
+
+    def __len__(self) -> int:
+        return len(self._connections)
+
+    def __iter__(self):
+        return iter(list(self._connections))
+
+    def __enter__(self) -> 'ConnectionGroup':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disconnect()
+
+
+class _Scheduler:
+    """
+    Single thread calling functions at monotonic deadlines, for debounced and
+    throttled emissions.
+    """
+
+    def __init__(self):
+        self._heap = []  # (deadline, seq, func, args)
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def call_at(self, deadline: float, func: Callable, *args):
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(_sequence), func, args))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='SignalScheduler',
+                                                daemon=True)
+                self._thread.start()
+            elif self._heap[0][0] == deadline:
+                # the new entry is the earliest; wake the thread to shorten its wait
+                self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    delay = self._heap[0][0] - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                _, _, func, args = heapq.heappop(self._heap)
+            try:
+                func(*args)
+            except Exception as e:
+                _reportException(e)
+
+
+_scheduler = _Scheduler()
+
+
 class Signal:
     """
     Signal class for event handling. Does not keep persistent any slots attached,
     so if other references to slots are destroyed, the slot will drop off the signal.
 
     :property _slots_structs: dict
-        Contains all typedefs and associated slots under that typedef.
-            Structured as: 
+        Contains all typedefs and the connections of slots under that typedef,
+        in connection order, keyed by slot key.
+            Structured as:
             {
-                tuple(typedef1): set([slot1, slot2, ...]),
-                tuple(typedef2): set([slot3, ...])
+                tuple(typedef1): {key1: Connection, key2: Connection, ...},
+                tuple(typedef2): {key3: Connection, ...}
             }
+    :property _connections: dict
+        Every connection by slot key, for O(1) lookup on connect and disconnect.
     """
-    _slots_structs: dict[tuple, WeakSet]
+    _slots_structs: dict[tuple, dict]
 
     def __init__(self, *typedefs,
-                 priority: int = SignalPriority.NORMAL):
+                 priority: int = SignalPriority.NORMAL,
+                 dispatch: str = DispatchMode.QUEUED,
+                 cache_size: int = 128,
+                 cache_policy: str = 'lru',
+                 name: str = None,
+                 coalesce=False,
+                 debounce: float = None,
+                 throttle: float = None,
+                 processor: str = None,
+                 key: Callable = None,
+                 lanes: int = 16):
         """
         Instantiate the class.
 
@@ -248,22 +1359,95 @@ class Signal:
         :param priority: int = SignalPriority.NORMAL
             The precedence all emitted signals from this instance take in
                 SignalProcessor's event dispatch relative to other Signals.
+        :param dispatch: str = DispatchMode.QUEUED
+            How slots are invoked on emission unless overridden per connection.
+        :param cache_size: int = 128
+            Maximum number of argument type tuples whose typedef similarity is
+                cached on this signal. None disables eviction.
+        :param cache_policy: str = 'lru'
+            Eviction policy of the similarity cache, 'lru' or 'lfu'.
+        :param name: str = None
+            Label identifying this signal in metrics; defaults to one derived from its id.
+        :param coalesce: bool | Callable = False
+            If True, an emission replaces the arguments of any pending, not yet
+                started emission of the same slot instead of queueing another
+                work item. A callable reducer(pending_args, new_args) -> args
+                merges them instead.
+        :param debounce: float = None
+            Seconds without further emissions before a slot runs, with the latest
+                (or reduced) arguments. Implies coalescing.
+        :param throttle: float = None
+            Minimum seconds between runs of a slot; emissions in between coalesce
+                into one trailing run. Implies coalescing.
+        :param processor: str = None
+            Name of the signal processor queued slots run on, see getSignalProcessor;
+                None for the default one.
+        :param key: Callable = None
+            Function of an emission's args and keyword args returning its
+                partition key, e.g. an account id. Emissions of equal keys reach
+                each slot in emission order, one at a time; different keys run in
+                parallel. See also emit_keyed().
+        :param lanes: int = 16
+            Number of serial lanes per slot that keys are hashed onto; keys
+                sharing a lane are serialized with each other too.
+
+        Coalescing applies to slots queued on the signal processor; directly
+        dispatched slots, PROCESS slots and emit_async() are never coalesced.
+        Keyed slots always run on the signal processor, through one mailbox per
+        lane as for serial connections (see connect). A keyed signal cannot coalesce.
         """
+        _checkDispatchMode(dispatch)
+        if debounce is not None and throttle is not None:
+            raise ValueError('A signal can debounce or throttle, not both')
+        if not (isinstance(coalesce, bool) or callable(coalesce)):
+            raise TypeError(f"'coalesce' must be a bool or a callable, not {type(coalesce)}")
+        if key is not None and not callable(key):
+            raise TypeError(f"'key' must be callable, not {type(key)}")
+        if key is not None and (coalesce or debounce is not None or throttle is not None):
+            raise ValueError('A keyed signal cannot coalesce, debounce or throttle')
+        if key is not None and dispatch in (DispatchMode.DIRECT, DispatchMode.PROCESS):
+            raise ValueError(f'A keyed signal cannot use {dispatch} dispatch')
+        if lanes < 1:
+            raise ValueError('lanes must be at least 1')
         self.priority = priority
-
-        self._slots_structs = {}  # stores typedefs as keys and WeakSets as items
-        self._weak_methods = {}  # needed to store WeakMethod instances
+        self.dispatch = dispatch
+        self.name = name if name is not None else f'{type(self).__name__}@{id(self):#x}'
+        self.processor = processor
+        self.key = key
+        self.lanes = lanes
+        self._similarity_cache = _SimilarityCache(cache_size, cache_policy)
+        # class distances by (emitted class, annotated class); per signal, like the
+        # similarity cache, so classes are only pinned while the signal lives
+        self._distances = {}
+
+        self._slots_structs = {}  # stores typedefs as keys and connections by slot key as items
+        self._connections = {}
+        # compiled dispatch table: exact emitted type tuple -> tuple of Connection
+        self._dispatch = {}
+        # same for keyword emissions: (type tuple, ((name, type), ...)) -> tuple of Connection
+        self._kw_dispatch = {}
+        self._lock = threading.RLock()
+
+        self.debounce = debounce
+        self.throttle = throttle
+        self._coalescing = bool(coalesce) or debounce is not None or throttle is not None
+        self._reducer = coalesce if callable(coalesce) and coalesce is not True else None
+        self._pending_lock = threading.Lock()
+        self.coalesced = 0  # emissions folded into a pending one
 
         for typedef in typedefs:
             if isinstance(typedef, Iterable):
-                self._slots_structs[tuple(typedef)] = WeakSet()
+                self._slots_structs[tuple(typedef)] = {}
                 self._slots_structs[tuple(
-                    [object for _ in typedef])] = WeakSet()
+                    [object for _ in typedef])] = {}
                 continue
             raise TypeError(
                 "Signal emission data type definitions must be Iterable, not " +
                 f"'{type(typedef)}'"
             )
+        # typedefs normalized for matching, e.g. Optional[int] -> (int, NoneType)
+        self._specs = {typedef: tuple(normalize(t) for t in typedef)
+                       for typedef in self._slots_structs}
 
     @property
     def typedefs(self) -> set[tuple]:
@@ -272,6 +1456,13 @@ class Signal:
         """
         return self._slots_structs.keys()
 
+    @property
+    def connected(self) -> bool:
+        """
+        True if at least one slot is connected to this signal.
+        """
+        return bool(self._connections)
+
     def slots(self, typedef: tuple, tolerance: int = float('inf')) -> set:
         """
         Return the set of slot functions to be called with arguments in the given typedef.
@@ -296,16 +1487,14 @@ class Signal:
             elif v[1] > tolerance:
                 # tolerance is too high for this result
                 continue
-            # append a copy to not screw with list
-            rtn += self._slots_structs[v[0]].copy()
-
-        # get references to methods themselves, not just weakMethods
-        for i in range(len(rtn)):
-            if isinstance(rtn[i], WeakMethod):
-                rtn[i] = rtn[i]()
+            # copy, as collected slots may remove themselves meanwhile
+            for connection in list(self._slots_structs[v[0]].values()):
+                slot = connection.ref()
+                if slot is not None:
+                    rtn.append(slot)
         return rtn
 
-    def connect(self, slot: Callable) -> None:
+    def connect(self, slot: Callable, dispatch: str = None, serial: bool = False) -> Connection:
         """
         Connect a slot to this Signal according to the slot's argument type annotations. 
 
@@ -313,77 +1502,501 @@ class Signal:
         type definitions according to either the @Slot(*types) decorator or
         type-hinting / annotations in the slot function definition.
 
-        NOTE: Does not work with variable-length arguments; TODO: include this capability using parameter.kind
+        A slot taking a varying number of positional arguments (defaults or
+        *args) is matched, at connection time, against the best typedef of
+        every length it accepts. Keyword-only and **kwargs parameters are only
+        bound by keyword emissions, see emit().
+
+        dispatch overrides the signal's DispatchMode for this connection only.
+
+        A serial connection gets a mailbox: emissions queue up in it and at
+        most one invocation of the slot runs at a time, in emission order, so
+        the slot needs no lock of its own. A single work item drains up to
+        MAILBOX_BATCH messages and is only queued while the mailbox holds any.
+        Serial slots always run on the signal processor; dispatch cannot be
+        DIRECT or PROCESS.
+
+        Connecting an already connected slot only updates its dispatch mode
+        and whether it is serial.
+
+        Returns the Connection, which can disconnect the slot again.
         """
-        # get annotated types from the slot, or 'object' for all if not specified
-        types = self._read_annotations(slot)
-        # build the similarity matrix
-        similar = [v for v in self._similarity(types) if v[1] >= 0]
+        if dispatch is not None:
+            _checkDispatchMode(dispatch)
+            if ((serial or self.key is not None)
+                    and dispatch in (DispatchMode.DIRECT, DispatchMode.PROCESS)):
+                raise ValueError(f'A serial or keyed connection cannot use {dispatch} dispatch')
+            if dispatch == DispatchMode.PROCESS:
+                try:
+                    pickle.dumps(slot)
+                except Exception as e:
+                    raise TypeError(
+                        f"Slot '{slot.__qualname__}' must be picklable to run in a process pool") from e
+        signature = inspect.signature(slot)
+        hints = typeHints(slot)
+        typedefs = self._match(signature, hints)
 
         # if no similar typedefs found, raise error
-        if len(similar) == 0:
+        if not typedefs:
             raise ValueError(
-                f"No similar signal type definitions found for '{slot.__qualname__}' with argument types ({types})")
+                f"No similar signal type definitions found for '{slot.__qualname__}' with signature {signature}")
+
+        key = _slotKey(slot)
+        with self._lock:
+            connection = self._connections.get(key)
+            if connection is not None:
+                # already connected; only the dispatch mode can change
+                connection.mode = dispatch
+                if serial != connection.serial:
+                    # messages already in a dropped mailbox are still delivered
+                    connection.mailbox = _Mailbox(connection) if serial else None
+                return connection
+
+            connection = Connection(self, slot, typedefs, signature, hints, dispatch, key,
+                                    serial)
+            self._connections[key] = connection
+            for typedef in typedefs:
+                self._slots_structs[typedef][key] = connection
+
+            # add the new slot to every compiled emission type it fires for
+            if not connection.required_keywords:
+                for types, refs in list(self._dispatch.items()):
+                    if (any(t in typedefs and d >= 0 for t, d in self._similarity(types))
+                            and _fits(connection, types, self._distances)):
+                        self._dispatch[types] = refs + (connection,)
+            # keyword entries are rare; recompile them on their next emission
+            self._kw_dispatch.clear()
+        return connection
+
+    def _match(self, signature: inspect.Signature, hints: dict) -> tuple:
+        """
+        Find the most similar typedef for each number of positional arguments
+        a slot with the given signature and resolved type hints accepts.
+        """
+        params = signature.parameters.values()
+        positional = [p for p in params if p.kind in (inspect.Parameter.POSITIONAL_ONLY,
+                                                      inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+        required = sum(1 for p in positional if p.default is p.empty)
+        variadic = next((p for p in params if p.kind is inspect.Parameter.VAR_POSITIONAL), None)
+
+        best = {}  # length -> (diff, typedef)
+        for typedef in self._slots_structs:
+            n = len(typedef)
+            if n < required or (variadic is None and n > len(positional)):
+                continue
+            # the slot's normalized annotations for n arguments; a spec of a
+            #   single class is given as the class, sharing cache entries with emissions
+            specs = (_paramSpec(hints, positional[i] if i < len(positional) else variadic)
+                     for i in range(n))
+            types = tuple(s[0] if len(s) == 1 else s for s in specs)
+            for t, diff in self._similarity(types):
+                if t == typedef and diff >= 0 and (n not in best or diff < best[n][0]):
+                    best[n] = (diff, typedef)
+        return tuple(typedef for _, typedef in best.values())
 
-        # unzip the similarity matrix
-        typedef = tuple(zip(*similar))
-        # locate the minimum 'difference' value, and pull the corresponding typedef
-        typedef = typedef[0][typedef[1].index(min(typedef[1]))]
+    def disconnect(self, slot: Callable) -> None:
+        """
+        Disconnect a slot from this signal. Disconnecting a slot that is not
+        connected does nothing.
+        """
+        self._discard(_slotKey(slot))
 
-        # WeakSets cannot hold bound methods from instanced classes, so we need to use
-        #   WeakMethod to hold the reference
-        if inspect.ismethod(slot):
-            wm = WeakMethod(slot)
-            finalize(wm, self._bound_method_deleted, slot.__qualname__)
-            self._weak_methods[slot.__qualname__] = wm
-            self._slots_structs[typedef].add(wm)
-        else:
-            self._slots_structs[typedef].add(slot)
+    def _discard(self, key, connection: Connection = None):
+        """
+        Remove the connection stored under key, only if it is the given one when
+        given. Compiled dispatch entries drop it on their next emission.
 
-        # clear the similarity cache to force an update on next call
-        self._similarity.cache_clear()
+        Also called from weakref callbacks, which may run on any thread at any
+        allocation, so it takes no lock; the dict operations are atomic.
+        """
+        if connection is not None:
+            if self._connections.get(key) is not connection:
+                return
+        connection = self._connections.pop(key, None)
+        if connection is None:
+            return
+        for typedef in connection.typedefs:
+            self._slots_structs[typedef].pop(key, None)
+        # also stops a pending coalesced emission from running
+        connection.ref = _deadRef
 
-    def disconnect(self, slot: Callable) -> None:
+    def emit(self, *args, **kwargs):
         """
-        Disconnect a slot from this signal.
+        Emit a signal with the given args and keyword args.
+
+        Slots are looked up in the compiled dispatch table for the exact
+        argument types, compiling the entry on first emission of those types.
+        Positional args select slots by typedef as usual; keyword args then
+        only reach slots able to bind all of them, by parameter name or
+        **kwargs, with types fitting their annotations.
         """
+        self._emit(args, kwargs,
+                   None if self.key is None else hash(self.key(*args, **kwargs)) % self.lanes)
 
-        # if slot is a bound method, need to delete the WeakMethod object
-        if inspect.ismethod(slot):
-            # should be only reference in here
-            del self._weak_methods[slot.__qualname__]
-            return
+    def emit_keyed(self, key, *args, **kwargs):
+        """
+        Emit a signal with the given args and keyword args under the given
+        partition key instead of the one the signal's key function returns,
+        see Signal(key=...). On a signal without a key function this is emit().
+        """
+        self._emit(args, kwargs, None if self.key is None else hash(key) % self.lanes)
 
-        # otherwise directly remove from the slot structures dict
-        for seq in self._slots_structs.values():
-            if slot in seq:
-                seq.remove(slot)
+    def _emit(self, args: tuple, kwargs: dict, lane: int):
+        """
+        Dispatch one emission to its slots; lane is the emission's lane on a
+        keyed signal, None otherwise.
+        """
+        types = tuple(map(type, args))
+        refs, kwtypes = self._refs(types, kwargs)
+
+        stale = False
+        for connection in refs:
+            handler = connection.ref()
+            if handler is None:
+                # slot was disconnected or garbage collected since the entry was compiled
+                stale = True
+                continue
+            mailbox = connection.mailbox
+            if mailbox is None and lane is not None:
+                mailbox = connection.lane(lane)
+            if mailbox is not None:
+                if self._coalescing:
+                    self._coalesce(connection, args, kwargs)
+                else:
+                    mailbox.push((None, args, kwargs, None))
+                continue
+            mode = self._mode(connection)
+            if mode == DispatchMode.DIRECT:
+                try:
+                    handler(*args, **kwargs)
+                except Exception as e:
+                    _reportException(e)
+                continue
+            if self._coalescing and mode == DispatchMode.QUEUED:
+                self._coalesce(connection, args, kwargs)
+                continue
+            registerEmission(
+                SignalTask(
+                    priority=self.priority,
+                    func=handler,
+                    args=args,
+                    source=self,
+                    kwargs=kwargs or None
+                ),
+                getProcessProcessor() if mode == DispatchMode.PROCESS else None,
+                future=False
+            )
 
-        # clear the similarity cache to force an update on next call
-        self._similarity.cache_clear()
+        if stale:
+            self._prune_dead(types, kwtypes)
 
-    def emit(self, *args):
+    def emit_many(self, emissions: Iterable[tuple], futures: bool = False) -> list:
         """
-        Emit a signal with the given args.
+        Emit a signal once for every argument tuple in emissions.
+
+        Emissions are grouped by argument types; slots are resolved once per
+        group and each slot receives a single work item that runs the whole
+        group in order. Exceptions raised by individual emissions are reported
+        without aborting the rest of the batch. Directly dispatched slots run
+        their batch before emit_many returns and have no future.
+
+        :param emissions: Iterable[tuple]
+            Argument tuples, each equivalent to the *args of one emit() call.
+        :param futures: bool = False
+            If True, return one Future per submitted batch.
+
+        A coalescing signal emits each tuple in turn instead, so only the last
+        (or reduced) arguments reach its queued slots; it returns no futures.
         """
-        # first, get the types of all arguments to determine the slots to call.
-        types = tuple([type(v) for v in args])
+        if self._coalescing:
+            for args in emissions:
+                self.emit(*args)
+            return [] if futures else None
 
-        # get all slots that should fire
-        slots = self.slots(types)
+        groups = {}
+        for args in emissions:
+            args = tuple(args)
+            groups.setdefault(tuple(map(type, args)), []).append(args)
 
-        # build the list of handler functions for passing arguments
-        for handler in slots:
+        rtn = []
+        for types, batch in groups.items():
+            refs, _ = self._refs(types, None)
+
+            batch = tuple(batch)
+            lanes = (None if self.key is None
+                     else [hash(self.key(*args)) % self.lanes for args in batch])
+            stale = False
+            for connection in refs:
+                handler = connection.ref()
+                if handler is None:
+                    stale = True
+                    continue
+                mailbox = connection.mailbox
+                if mailbox is not None:
+                    for args in batch:
+                        mailbox.push((None, args, None, None))
+                    continue
+                if lanes is not None:
+                    for args, lane in zip(batch, lanes):
+                        connection.lane(lane).push((None, args, None, None))
+                    continue
+                mode = self._mode(connection)
+                if mode == DispatchMode.DIRECT:
+                    _runBatch(handler, batch)
+                    continue
+                future = registerEmissions(
+                    SignalTask(
+                        priority=self.priority,
+                        func=handler,
+                        args=batch,
+                        source=self
+                    ),
+                    getProcessProcessor() if mode == DispatchMode.PROCESS else None,
+                    future=futures
+                )
+                if futures:
+                    rtn.append(future)
+
+            if stale:
+                self._prune_dead(types)
+        return rtn if futures else None
+
+    async def emit_async(self, *args, **kwargs) -> list:
+        """
+        Emit a signal with the given args and keyword args and wait until every
+        slot has finished.
+
+        Returns the slots' results in dispatch order, with the raised exception
+        in place of the result of any slot that failed (failures are reported
+        as usual). Awaitables returned by directly dispatched slots are awaited.
+        """
+        types = tuple(map(type, args))
+        refs, kwtypes = self._refs(types, kwargs)
+
+        lane = None if self.key is None else hash(self.key(*args, **kwargs)) % self.lanes
+        pending = []
+        stale = False
+        for connection in refs:
+            handler = connection.ref()
+            if handler is None:
+                stale = True
+                continue
+            mailbox = connection.mailbox
+            if mailbox is None and lane is not None:
+                mailbox = connection.lane(lane)
+            if mailbox is not None:
+                future = Future()
+                mailbox.push((None, args, kwargs, future))
+                pending.append(asyncio.wrap_future(future))
+                continue
+            mode = self._mode(connection)
+            if mode == DispatchMode.DIRECT:
+                try:
+                    result = handler(*args, **kwargs)
+                except Exception as e:
+                    _reportException(e)
+                    result = e
+                pending.append(_settle(result))
+                continue
+            future = registerEmission(
+                SignalTask(
+                    priority=self.priority,
+                    func=handler,
+                    args=args,
+                    source=self,
+                    kwargs=kwargs or None
+                ),
+                getProcessProcessor() if mode == DispatchMode.PROCESS else None
+            )
+            pending.append(asyncio.wrap_future(future))
+
+        if stale:
+            self._prune_dead(types, kwtypes)
+        return list(await asyncio.gather(*pending, return_exceptions=True))
+
+    def _coalesce(self, connection: Connection, args: tuple, kwargs: dict):
+        """
+        Store args as the pending emission of a connection, queueing a
+        work item to run it unless one is already pending or a debounce or
+        throttle window defers it. Keyword args are not reduced; the latest win.
+        """
+        now = time.monotonic()
+        leading = False
+        with self._pending_lock:
+            cell = connection.pending
+            if cell is None:
+                cell = connection.pending = _PendingEmission(self, connection)
+            if self.debounce is not None:
+                cell.deadline = now + self.debounce
+            if cell.args is not None:
+                cell.args = args if self._reducer is None else self._reducer(cell.args, args)
+                cell.kwargs = kwargs
+                self.coalesced += 1
+                return
+            if self.debounce is not None:
+                delay = self.debounce
+            elif self.throttle is not None:
+                delay = cell.last_run + self.throttle - now
+                if delay <= 0:
+                    # the leading run of a throttle window keeps its own arguments
+                    cell.last_run = now
+                    leading = True
+            else:
+                delay = 0
+            if not leading:
+                cell.args = args
+                cell.kwargs = kwargs
+                if delay > 0:
+                    _scheduler.call_at(now + delay, _firePending, cell)
+                    return
+                cell.posted = True
+        if not leading:
+            self._postPending(cell)
+            return
+        if connection.mailbox is not None:
+            connection.mailbox.push((None, args, kwargs, None))
+            return
+        handler = connection.ref()
+        if handler is not None:
             registerEmission(
                 SignalTask(
                     priority=self.priority,
                     func=handler,
                     args=args,
-                    source=self
-                )
+                    source=self,
+                    kwargs=kwargs or None
+                ),
+                future=False
             )
 
-    @lru_cache(maxsize=10)
+    def _postPending(self, cell: _PendingEmission):
+        mailbox = cell.connection.mailbox
+        if mailbox is not None:
+            mailbox.push((_runPending, (cell,), None, None))
+            return
+        # a lost runner would leave the cell posted for good, so it skips the overflow policy
+        task = SignalTask(
+            priority=self.priority,
+            func=_runPending,
+            args=(cell,),
+            source=self,
+            slot=cell.connection.ref()
+        )
+        try:
+            _register(task.func, task.args, task, None, future=False, bounded=False)
+        except BaseException:
+            # e.g. the processor was shut down; the next emission posts again
+            with self._pending_lock:
+                cell.posted = False
+            raise
+
+    def _postMailbox(self, mailbox: _Mailbox):
+        # a lost drain item would stall the mailbox for good, so it skips the overflow policy
+        task = SignalTask(
+            priority=self.priority,
+            func=_drainMailbox,
+            args=(mailbox,),
+            source=self,
+            slot=mailbox.connection.ref()
+        )
+        _register(task.func, task.args, task, None, future=False, bounded=False)
+
+    def flush(self):
+        """
+        Queue every emission held back by debounce or throttle now.
+        """
+        with self._pending_lock:
+            cells = [c.pending for c in list(self._connections.values())
+                     if c.pending is not None and c.pending.args is not None
+                     and not c.pending.posted]
+            for cell in cells:
+                cell.posted = True
+        for cell in cells:
+            self._postPending(cell)
+
+    def _refs(self, types: tuple, kwargs: dict) -> tuple:
+        """
+        The compiled dispatch entry for an emission's argument types, compiled
+        on first use, and the keyword argument types keying it (None without
+        keyword args).
+        """
+        if kwargs:
+            kwtypes = tuple((name, type(value)) for name, value in kwargs.items())
+            refs = self._kw_dispatch.get((types, kwtypes))
+            if refs is None:
+                refs = self._compile(types, kwtypes)
+            return refs, kwtypes
+        refs = self._dispatch.get(types)
+        if refs is None:
+            refs = self._compile(types)
+        return refs, None
+
+    def _mode(self, connection: Connection) -> str:
+        """
+        The dispatch mode a connection's slot runs in for an emission from the
+        calling thread, resolving the signal's default and AUTO.
+        """
+        mode = connection.mode
+        if mode is None:
+            mode = self.dispatch
+        if mode == DispatchMode.AUTO:
+            return DispatchMode.DIRECT if _onProcessor(self.processor) else DispatchMode.QUEUED
+        return mode
+
+    def _prune_dead(self, types: tuple, kwtypes: tuple = None):
+        """
+        Remove references to garbage collected slots from a compiled dispatch entry.
+        """
+        with self._lock:
+            if kwtypes is None:
+                table, key = self._dispatch, types
+            else:
+                table, key = self._kw_dispatch, (types, kwtypes)
+            table[key] = tuple(c for c in table.get(key, ()) if c.ref() is not None)
+
+    def _compile(self, types: tuple, kwtypes: tuple = None) -> tuple:
+        """
+        Build the dispatch table entry for an exact emitted type tuple, and
+        the (name, type) pairs of keyword arguments if any.
+
+        Entries hold the connection of every slot that fires for the given
+        types, so a repeated emission only dereferences them instead of
+        re-matching typedefs and copying slot sets.
+        """
+        with self._lock:
+            refs = []
+            for typedef, diff in self._similarity(types):
+                if diff < 0:
+                    continue
+                for connection in list(self._slots_structs[typedef].values()):
+                    if not _fits(connection, types, self._distances):
+                        # a slot only receives what its own annotations accept
+                        continue
+                    if kwtypes is None:
+                        if not connection.required_keywords:
+                            refs.append(connection)
+                    elif _acceptsKeywords(connection, len(types), kwtypes, self._distances):
+                        refs.append(connection)
+            refs = tuple(refs)
+            if kwtypes is None:
+                self._dispatch[types] = refs
+            else:
+                self._kw_dispatch[(types, kwtypes)] = refs
+        return refs
+
+    def cache_info(self) -> SimilarityCacheInfo:
+        """
+        Report hits, misses, maximum and current size of this signal's similarity cache.
+        """
+        return self._similarity_cache.info()
+
+    def cache_clear(self) -> None:
+        """
+        Empty this signal's similarity cache and reset its counters.
+        """
+        self._similarity_cache.clear()
+        self._distances.clear()
+
     def _similarity(self, typedef: tuple) -> tuple[tuple, int]:
         """
         Compares the given typedef to all explicit typedefs on this signal,
@@ -394,6 +2007,10 @@ class Signal:
         defined types are more generic (in the case of interitance), such that
         one child class doesn't send signals to another child class.
 
+        Items of typedef are classes, or specs (tuples of alternative classes)
+        from normalizing slot annotations. Typing constructs in the signal's
+        typedefs are matched as normalized at construction; see _matching.
+
         Return Values:
         --------------
         -2 :: argument lengths do not match
@@ -401,6 +2018,9 @@ class Signal:
          0 :: all argument types match perfectly
         >0 :: how far removed the given typedef is from an explicit typedef based on MRO chain
 
+        Results are cached per signal; typedefs are fixed at construction, so
+        entries never need to be invalidated when slots change.
+
         Raises:
         -------
         TypeError: if typedef argument not a tuple.
@@ -410,52 +2030,41 @@ class Signal:
                 f"'typedef' parameter must be tuple, not {type(typedef)}"
             )
 
+        rtn = self._similarity_cache.get(typedef)
+        if rtn is None:
+            rtn = self._compute_similarity(typedef)
+            self._similarity_cache.put(typedef, rtn)
+        return rtn
+
+    def _compute_similarity(self, typedef: tuple) -> tuple[tuple, int]:
+        """
+        Uncached body of _similarity.
+        """
         rtn = []
+        given = tuple(t if isinstance(t, tuple) else (t,) for t in typedef)
 
-        for cmp in zip([typedef for _ in self.typedefs], self.typedefs):
-            if len(cmp[0]) != len(cmp[1]):
+        for explicit, specs in self._specs.items():
+            if len(given) != len(specs):
                 # argument length not matched
-                rtn.append((cmp[1], -2))
+                rtn.append((explicit, -2))
                 continue
-            elif all([v[0] == v[1] for v in zip(cmp[0], cmp[1])]):
+            elif typedef == explicit:
                 # perfect match
-                rtn.append((cmp[1], 0))
+                rtn.append((explicit, 0))
                 continue
 
             diff = 0
-            for s in zip(cmp[0], cmp[1]):
-                try:
-                    # get the MRO index value of value 1 in value 0's MRO
-                    idx = inspect.getmro(s[0]).index(s[1])
-                    diff += idx
-                except ValueError:
+            for g, spec in zip(given, specs):
+                d = specDistance(g, spec, self._distances)
+                if d < 0:
                     # at least one argument is not in the MRO of the current typedef
-                    rtn.append((cmp[1], -1))
+                    rtn.append((explicit, -1))
                     break
+                diff += d
             else:
                 # append the tallied differences
-                rtn.append((cmp[1], diff))
-        return rtn
-
-    def _read_annotations(self, slot: Callable) -> tuple[type]:
-        """
-        Determine the annotated typedef for a given slot.
-
-        Checks annotations on function arguments, defaulting to 'object'
-        if no annotation exists.
-        """
-        params = inspect.signature(slot).parameters
-        types = (
-            v.annotation if v.annotation is not inspect._empty else object for v in params.values())
-        return tuple(types)
-
-    def _bound_method_deleted(self, name: str):
-        # FIXME: need to verify this is cleaning up objects appropriately
-        # and not becoming a memory leak problem.
-        for key in self._slots_structs.keys():
-            if self._weak_methods.get(name, None) in self._slots_structs[key]:
-                self._slots_structs[key].remove(self._weak_methods[name])
-                del self._weak_methods[name]
+                rtn.append((explicit, diff))
+        return tuple(rtn)
 
 
 @dataclass(order=True)
@@ -464,39 +2073,463 @@ class SignalTask:
     func: Callable = field(compare=False)
     args: tuple = field(compare=False)
     source: Signal = field(compare=False)
+    kwargs: dict = field(default=None, compare=False)
+    # the slot func runs for, when func is a wrapper around it; labels metrics
+    slot: Callable = field(default=None, compare=False)
 
 
-_processor: PriorityThreadPoolExecutor = None
+class PriorityProcessPoolExecutor:
+    """
+    Runs picklable callables in a pool of worker processes, in SignalPriority order.
+
+    Submissions wait in a priority work queue; a feeder thread hands the most
+    urgent one to the underlying ProcessPoolExecutor only when one of its
+    workers is free, so the process pool's own FIFO queue never reorders them.
+    """
 
+    def __init__(self, max_workers: int = None, queue_type: type = PriorityLevelQueue,
+                 mp_context=None):
+        """
+        :param max_workers: int = None
+            Number of worker processes, defaulting to the number of CPUs.
+        :param queue_type: type = PriorityLevelQueue
+            Priority work queue class holding submissions not yet handed to a process.
+        :param mp_context: multiprocessing context used to start the worker processes.
+        """
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(self._max_workers, mp_context=mp_context)
+        self._free = threading.Semaphore(self._max_workers)
+        self._work_queue = queue_type()
+        self._shutdown = False
+        self._shutdown_lock = threading.Lock()
+        self._feeder = threading.Thread(
+            target=self._feed, name='SignalProcessPoolFeeder', daemon=True)
+        self._feeder.start()
 
-def getSignalProcessor(thread_ct: int = 10):
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """
+        Queue fn(*args, **kwargs) for a worker process. Accepts the priority keyword.
+        """
+        priority = kwargs.pop('priority', SignalPriority.NORMAL)
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            f = Future()
+            self._work_queue.put(
+                PriorityWorkItem(priority, next(_sequence), (fn, args, kwargs, f)))
+            return f
+
+    def _feed(self):
+        while True:
+            self._free.acquire()
+            item = self._work_queue.get()
+            if item is NULL_PRIORITY_ITEM:
+                self._work_queue.task_done()
+                break
+            fn, args, kwargs, f = item.task
+            if not f.set_running_or_notify_cancel():
+                self._release()
+                continue
+            try:
+                inner = self._pool.submit(fn, *args, **kwargs)
+            except BaseException as e:
+                f.set_exception(e)
+                self._release()
+                continue
+            inner.add_done_callback(functools.partial(self._done, f))
+
+    def _done(self, f: Future, inner: Future):
+        try:
+            f.set_result(inner.result())
+        except BaseException as e:
+            f.set_exception(e)
+        self._release()
+
+    def _release(self):
+        self._free.release()
+        self._work_queue.task_done()
+
+    def join(self):
+        """
+        Wait for all queued callables to finish
+        """
+        self._work_queue.join()
+
+    def shutdown(self, wait=True):
+        """
+        Stop accepting submissions and shut the process pool down once the queue drains
+        """
+        with self._shutdown_lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+        _putUnbounded(self._work_queue, NULL_PRIORITY_ITEM)
+        if wait:
+            self._feeder.join()
+        self._pool.shutdown(wait=wait)
+
+
+DEFAULT_PROCESSOR = 'default'
+
+# signal processors by name; the default one is built on first use
+_processors: dict = {}
+_processors_lock = threading.Lock()
+_process_processor: PriorityProcessPoolExecutor = None
+_metrics: SignalMetrics = None
+_error_reporter: ErrorReporter = None
+
+# emitted with the record of every exception delivered by the default error reporter
+errorOccurred = Signal([dict], name='errorOccurred')
+
+
+async def _settle(result):
     """
-    Returns the signal processor thread pool, building it if necessary.
+    Await a directly dispatched slot's result if it is awaitable, reporting its failure.
     """
-    global _processor
-    if _processor is None:
-        _processor = PriorityThreadPoolExecutor(
-            max_workers=thread_ct, thread_name_prefix='SignalProcessor')
-    return _processor
+    if not inspect.isawaitable(result):
+        return result
+    try:
+        return await result
+    except Exception as e:
+        _reportException(e)
+        raise
 
 
-def registerEmission(task: SignalTask):
+def getSignalProcessor(thread_ct: int = None, queue_type: type = None,
+                       max_queue: int = None, overflow: str = None,
+                       name: str = DEFAULT_PROCESSOR, min_workers: int = None,
+                       idle_timeout: float = _KEEP, prestart: int = 0,
+                       scale_up_depth: int = None, scale_up_wait: float = None):
     """
-    Submit a work task to the thread pool executor.
+    Returns the signal processor thread pool of the given name, building it if necessary.
+
+    Signals use the default processor unless constructed with processor=name;
+    separate processors keep slow slots from delaying latency-critical ones.
+    The remaining arguments configure the pool:
+
+    queue_type selects the work queue: PriorityHeapQueue (heap, the default),
+    PriorityLevelQueue (one deque per priority) or WorkStealingQueue (one heap
+    per worker, for cascading signals). max_queue bounds the queue
+    depth (0, the default, for unbounded) and overflow is the OverflowPolicy
+    applied to emissions while it is full (default BLOCK); the processor's
+    dropped and blocked attributes count emissions affected by it.
+
+    The pool keeps between min_workers (default 0) and thread_ct (default 10)
+    threads: workers start as work queues up and retire after idling for
+    idle_timeout seconds (default 60, None keeps them). A worker is only started when
+    none is idle; prestart starts that many idle workers up front, so the first
+    emissions do not wait for threads. Beyond that, a worker starts once
+    scale_up_depth (default 1) items are queued, or once no worker has taken
+    an item for scale_up_wait seconds while work is queued (None disables).
+    Arguments passed for a processor that already exists, which the first
+    emission builds with the defaults, reconfigure it (see bound and resize);
+    its queue_type cannot change, so a different one raises ValueError.
     """
-    future = getSignalProcessor().submit(
-        task.func, *task.args, priority=task.priority
-    )
-    future.add_done_callback(onFutureComplete)
+    processor = _processors.get(name)
+    if processor is None:
+        with _processors_lock:
+            processor = _processors.get(name)
+            if processor is None:
+                prefix = ('SignalProcessor' if name == DEFAULT_PROCESSOR
+                          else f'SignalProcessor-{name}')
+                processor = _processors[name] = PriorityThreadPoolExecutor(
+                    queue_type=queue_type or PriorityHeapQueue, max_queue=max_queue or 0,
+                    overflow=overflow or OverflowPolicy.BLOCK,
+                    max_workers=thread_ct or 10, min_workers=min_workers or 0,
+                    idle_timeout=60.0 if idle_timeout is _KEEP else idle_timeout,
+                    scale_up_depth=scale_up_depth or 1,
+                    scale_up_wait=scale_up_wait, thread_name_prefix=prefix)
+                if prestart:
+                    processor.prestart(prestart)
+                return processor
+    if isinstance(processor, PriorityThreadPoolExecutor):
+        if queue_type is not None and type(processor._work_queue) is not queue_type:
+            raise ValueError(
+                f"Signal processor '{name}' uses a {type(processor._work_queue).__name__}, "
+                f"it cannot change to {queue_type.__name__}")
+        if max_queue is not None or overflow is not None:
+            processor.bound(max_queue, overflow)
+        if (thread_ct is not None or min_workers is not None or scale_up_depth is not None
+                or scale_up_wait is not None or idle_timeout is not _KEEP):
+            processor.resize(thread_ct, min_workers, scale_up_depth,
+                             _KEEP if scale_up_wait is None else scale_up_wait,
+                             idle_timeout)
+        if prestart:
+            processor.prestart(prestart)
+    return processor
+
+
+def _onProcessor(name: str) -> bool:
+    """
+    Whether the calling thread is a worker of the named signal processor (None for the default).
+    """
+    owner = getattr(_worker_state, 'owner', None)
+    return owner is not None and owner() is _processors.get(name or DEFAULT_PROCESSOR)
 
 
-def join():
+def getProcessProcessor(worker_ct: int = None) -> PriorityProcessPoolExecutor:
     """
-    Wait for all tasks in the SignalProcessor work queue to complete before returning.
+    Returns the process pool used by DispatchMode.PROCESS connections, building it if necessary.
+
+    Its worker count cannot change once built; a different worker_ct raises ValueError.
     """
-    if _processor is None:
+    global _process_processor
+    if _process_processor is None:
+        _process_processor = PriorityProcessPoolExecutor(max_workers=worker_ct)
+    elif worker_ct is not None and worker_ct != _process_processor._max_workers:
+        raise ValueError(
+            f'The process processor runs {_process_processor._max_workers} workers, '
+            f'it cannot change to {worker_ct}')
+    return _process_processor
+
+
+def setSignalProcessor(processor, name: str = DEFAULT_PROCESSOR):
+    """
+    Install a signal processor under the given name, by default in place of
+    the default thread pool, returning the previously installed one (which is
+    not shut down). None uninstalls.
+
+    A processor provides submit(fn, *args, priority=...) returning a
+    concurrent.futures.Future, join() and shutdown(wait), e.g. AsyncSignalProcessor.
+    """
+    with _processors_lock:
+        previous = _processors.pop(name, None)
+        if processor is not None:
+            _processors[name] = processor
+    return previous
+
+
+def processorStats() -> dict:
+    """
+    Statistics of every signal processor by name, as reported by its stats() method.
+    """
+    return {name: processor.stats() if hasattr(processor, 'stats') else {}
+            for name, processor in list(_processors.items())}
+
+
+def registerEmission(task: SignalTask, processor=None, future: bool = True) -> Future:
+    """
+    Submit a work task to the signal processor, or to the given processor.
+
+    With future=False the task is posted without a Future if the processor
+    supports it (see PriorityThreadPoolExecutor.post) and None is returned;
+    exceptions are still reported.
+    """
+    func = task.func if not task.kwargs else functools.partial(task.func, **task.kwargs)
+    return _register(func, task.args, task, processor, future)
+
+
+def registerEmissions(task: SignalTask, processor=None, future: bool = True) -> Future:
+    """
+    Submit a batch work task to the signal processor, or to the given processor.
+
+    The task's args hold a sequence of argument tuples; a single work item
+    calls the task's func once per tuple, in order. future is as for registerEmission.
+    """
+    return _register(_runBatch, (task.func, task.args), task, processor, future)
+
+
+def _register(func: Callable, args: tuple, task: SignalTask, processor, future: bool,
+              bounded: bool = True) -> Future:
+    if processor is None:
+        processor = getSignalProcessor(
+            name=getattr(task.source, 'processor', None) or DEFAULT_PROCESSOR)
+        metrics = _metrics
+        if metrics is not None:
+            # labels are resolved here, once, so the worker only times and records
+            slot = task.slot if task.slot is not None else task.func
+            label = getattr(slot, '__qualname__', None) or repr(slot)
+            args = (metrics, (_signalName(task.source), label), time.perf_counter_ns(),
+                    func, args)
+            func = _timedCall
+    if not future:
+        post = getattr(processor, 'post', None)
+        if post is not None:
+            if bounded:
+                post(func, *args, priority=task.priority)
+            else:
+                post(func, *args, priority=task.priority, bounded=False)
+            return None
+    rtn = processor.submit(func, *args, priority=task.priority)
+    rtn.add_done_callback(onFutureComplete)
+    return rtn
+
+
+def _firePending(cell: _PendingEmission):
+    """
+    Scheduler callback at the end of a debounce or throttle window.
+    """
+    signal = cell.signal
+    with signal._pending_lock:
+        if cell.args is None or cell.posted:
+            return
+        if cell.deadline > time.monotonic():
+            # emitted again during the debounce window
+            _scheduler.call_at(cell.deadline, _firePending, cell)
+            return
+        cell.posted = True
+    signal._postPending(cell)
+
+
+def _runPending(cell: _PendingEmission):
+    """
+    Worker side of a coalesced emission: run the slot with the latest pending arguments.
+    """
+    with cell.signal._pending_lock:
+        args, cell.args = cell.args, None
+        kwargs, cell.kwargs = cell.kwargs, None
+        cell.posted = False
+        cell.last_run = time.monotonic()
+    if args is None:
         return
-    _processor._work_queue.join()
+    # dead once disconnected, even while pending
+    handler = cell.connection.ref()
+    if handler is not None:
+        handler(*args, **kwargs)
+
+
+def _drainMailbox(mailbox: _Mailbox):
+    """
+    Worker side of a serial connection: run up to MAILBOX_BATCH messages in
+    order, then queue the mailbox again if more arrived meanwhile.
+    """
+    messages = mailbox.messages
+    for _ in range(MAILBOX_BATCH):
+        try:
+            func, args, kwargs, future = messages.popleft()
+        except IndexError:
+            break
+        if func is None:
+            # dead once disconnected, even with messages waiting
+            func = mailbox.connection.ref()
+            if func is None:
+                if future is not None:
+                    future.cancel()
+                continue
+        try:
+            result = func(*args, **kwargs) if kwargs else func(*args)
+        except Exception as e:
+            _reportException(e)
+            if future is not None:
+                future.set_exception(e)
+        else:
+            if future is not None:
+                future.set_result(result)
+    with mailbox.lock:
+        if not messages:
+            mailbox.scheduled = False
+            return
+    mailbox.post()
+
+
+def _signalName(source) -> str:
+    return source.name if isinstance(source, Signal) else repr(source)
+
+
+def _timedCall(metrics: SignalMetrics, key: tuple, enqueued: int, func: Callable, args: tuple,
+               _now=time.perf_counter_ns):
+    """
+    Call func(*args), recording queue wait and run time of the task into metrics
+    under key, the (signal, slot) label pair. Only the synchronous part of
+    slots returning an awaitable is timed.
+    """
+    started = _now()
+    try:
+        return func(*args)
+    finally:
+        metrics.record_key(key, enqueued, started, _now())
+
+
+def enableMetrics() -> SignalMetrics:
+    """
+    Start recording emission metrics for the signal processor, discarding earlier records.
+
+    Covers tasks queued on the signal processor from now on; directly dispatched
+    slots and process pool slots are not recorded.
+
+    Recording adds about 1µs to every queued task: three clock reads, the
+    timing wrapper and a buffered record. On a slow machine this measured
+    0.8-1.4µs per task.
+    """
+    global _metrics
+    _metrics = SignalMetrics()
+    return _metrics
+
+
+def disableMetrics():
+    """
+    Stop recording emission metrics.
+    """
+    global _metrics
+    _metrics = None
+
+
+def metricsSnapshot(processor: str = None) -> dict:
+    """
+    Aggregated emission metrics since enableMetrics(), or None if not enabled.
+
+    Reports queue wait and run time histograms per signal name and per slot
+    qualname, and the current queue depth per priority and worker utilization
+    of the named signal processor (all of them together if None).
+    """
+    metrics = _metrics
+    if metrics is None:
+        return None
+    if processor is None:
+        processors = list(_processors.values())
+    else:
+        processors = [_processors[processor]] if processor in _processors else []
+    depths = {}
+    workers = 0
+    for p in processors:
+        work_queue = getattr(p, '_work_queue', None)
+        if hasattr(work_queue, 'depths'):
+            for priority, n in work_queue.depths().items():
+                depths[priority] = depths.get(priority, 0) + n
+        workers += len(getattr(p, '_threads', ()))
+    return metrics.snapshot(queue_depth=depths, workers=workers)
+
+
+def _runBatch(func: Callable, batch: tuple):
+    """
+    Call func with each argument tuple in batch, reporting but not propagating errors.
+    """
+    for args in batch:
+        try:
+            func(*args)
+        except Exception as e:
+            _reportException(e)
+
+
+def join(name: str = None):
+    """
+    Wait for all tasks in the named signal processor's work queue to complete
+    before returning, then for the exceptions they raised to be reported.
+
+    With no name, waits for every signal processor and the process pool, until
+    none of them has work left, so tasks emitted from one processor to another
+    are waited for too.
+    """
+    if name is not None:
+        processor = _processors.get(name)
+        if processor is not None:
+            processor.join()
+    else:
+        while True:
+            processors = list(_processors.values())
+            for processor in processors:
+                processor.join()
+            if _process_processor is not None:
+                _process_processor.join()
+            if all(_idle(p) for p in processors):
+                break
+    if _error_reporter is not None:
+        _error_reporter.flush()
+
+
+def _idle(processor) -> bool:
+    work_queue = getattr(processor, '_work_queue', None)
+    return work_queue is None or work_queue.unfinished_tasks == 0
 
 
 def onFutureComplete(fut: Future):
@@ -504,42 +2537,68 @@ def onFutureComplete(fut: Future):
     Default completion callback for all signal processor future objects.
     Provides error handling if an exception is thrown in the future object.
     """
-    global _processor
-    e = fut.exception()
-    if e is None:
-        _processor._work_queue.task_done()
+    if fut.cancelled():
+        # dropped by the processor's overflow policy
         return
-    trace = []
-    tb = traceback.extract_tb(e.__traceback__)
+    e = fut.exception()
+    if e is not None:
+        _reportException(e)
 
-    for frame in tb:
-        trace.append(
-            {
-                'filename': frame.filename,
-                'name': frame.name,
-                'lineno': frame.lineno,
-                'line': frame.line
-            }
-        )
-    result = {
-        'type': type(e).__name__,
-        'message': str(e),
-        'thread': threading.current_thread().name,
-        'trace': trace
-    }
-    print(json.dumps(result, indent=4))
-    _processor._work_queue.task_done()
 
+def _reportException(e: BaseException):
+    """
+    Hand an exception raised by a slot to the error reporter. Formatting and
+    delivery happen on the reporter's thread, not the caller's.
+    """
+    reporter = _error_reporter
+    if reporter is None:
+        reporter = getErrorReporter()
+    reporter.report(e)
 
-def shutdown():
+
+def getErrorReporter() -> ErrorReporter:
     """
-    Kills the thread pool executor
+    Get the error reporter, creating the default one if there is none. The
+    default logs to the 'signals' logger and emits on errorOccurred.
     """
-    global _processor
-    if _processor is None:
-        return
-    _processor.shutdown(wait=True)
-    _processor = None
+    global _error_reporter
+    if _error_reporter is None:
+        _error_reporter = ErrorReporter(sinks=[LoggingSink(), SignalSink(errorOccurred)])
+    return _error_reporter
+
+
+def setErrorReporter(reporter: ErrorReporter) -> ErrorReporter:
+    """
+    Replace the error reporter, returning the previous one (which may be None).
+    The previous reporter is flushed so nothing already reported is lost.
+    """
+    global _error_reporter
+    previous, _error_reporter = _error_reporter, reporter
+    if previous is not None:
+        previous.flush()
+    return previous
+
+
+def shutdown(name: str = None):
+    """
+    Kills the named signal processor, or with no name every signal processor
+    and the process pool. A processor used again afterwards is rebuilt.
+    """
+    global _process_processor
+    if name is None:
+        if _process_processor is not None:
+            _process_processor.shutdown(wait=True)
+            _process_processor = None
+        names = list(_processors)
+    else:
+        names = [name]
+    for n in names:
+        with _processors_lock:
+            processor = _processors.pop(n, None)
+        if processor is not None:
+            processor.shutdown(wait=True)
+    if _error_reporter is not None:
+        _error_reporter.flush()
 
 
 # ----------------------------------------------------------------------------------
@@ -548,6 +2607,53 @@ def shutdown():
 # ----------------------------------------------------------------------------------
 
 
+def _compileArgumentPacker(sig: inspect.Signature) -> Callable:
+    """
+    Build a function ordering a call's (args, kwargs) into a tuple of every
+    parameter value, defaults applied, as Signature.bind would.
+
+    Signatures made only of positional parameters get a fast path that avoids
+    bind(); anything else (variadic or keyword-only parameters, or calls the
+    fast path cannot resolve) falls back to bind(), which also raises the
+    TypeError for invalid calls.
+    """
+    params = tuple(sig.parameters.values())
+
+    def bind(args, kwargs):
+        bound_args = sig.bind(*args, **kwargs)
+        bound_args.apply_defaults()
+        return tuple(bound_args.arguments[param.name] for param in params)
+
+    positional = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    if not all(param.kind in positional for param in params):
+        return bind
+
+    count = len(params)
+    names = tuple(param.name for param in params)
+    defaults = {param.name: param.default for param in params
+                if param.default is not inspect.Parameter.empty}
+    # keyword-passable parameter names remaining after i positional arguments
+    remaining = tuple(
+        frozenset(param.name for param in params[i:]
+                  if param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        for i in range(count + 1))
+
+    def pack(args, kwargs):
+        given = len(args)
+        if given == count and not kwargs:
+            return args
+        if given <= count and kwargs.keys() <= remaining[given]:
+            try:
+                return args + tuple(kwargs[name] if name in kwargs else defaults[name]
+                                    for name in names[given:])
+            except KeyError:
+                # a required argument is missing; let bind() raise the TypeError
+                pass
+        return bind(args, kwargs)
+
+    return pack
+
+
 class SignalFactory:
     """
     Decorator class to be added to functions, bound methods, etc.
@@ -571,28 +2677,27 @@ class SignalFactory:
 
     def __call__(self, func) -> 'SignalFactory':
         sig = inspect.signature(func)
+        pack = _compileArgumentPacker(sig)
+
+        # bound below, once the signals exist; None if not requested
+        onCall = onError = onComplete = None
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            bound_args = sig.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-            ordered = tuple(bound_args.arguments[param.name]
-                            for param in sig.parameters.values())
-
-            # emit the onCall signal with arguments passed
-            if hasattr(wrapper, "onCall"):
-                wrapper.onCall.emit(func, ordered)
+            # emit the onCall signal with arguments passed, if anyone listens
+            if onCall is not None and onCall.connected:
+                onCall.emit(func, pack(args, kwargs))
             try:
                 result = func(*args, **kwargs)
             except Exception as e:
                 # emit the onError signal with exception message
-                if hasattr(wrapper, "onError"):
-                    wrapper.onError.emit(func, e)
+                if onError is not None and onError.connected:
+                    onError.emit(func, e)
                 raise e
             else:
                 # emit the onCompleted signal with return value
-                if hasattr(wrapper, "onComplete"):
-                    wrapper.onComplete.emit(func, result)
+                if onComplete is not None and onComplete.connected:
+                    onComplete.emit(func, result)
                 return result
 
         self.__wrapped__ = wrapper
@@ -607,13 +2712,13 @@ class SignalFactory:
 
         if self.__onCall:
             # signal data types are (calling_func, *arg_t)
-            wrapper.onCall = Signal((Callable, Iterable))
+            wrapper.onCall = onCall = Signal((Callable, Iterable), name=f'{func.__qualname__}.onCall')
         if self.__onError:
             # signal data types are (calling_func, Exception)
-            wrapper.onError = Signal((Callable, Exception))
+            wrapper.onError = onError = Signal((Callable, Exception), name=f'{func.__qualname__}.onError')
         if self.__onComplete:
             # signal data types are (calling_func, *arg_t)
-            wrapper.onComplete = Signal(rtn_type)
+            wrapper.onComplete = onComplete = Signal(rtn_type, name=f'{func.__qualname__}.onComplete')
 
         return wrapper
 
@@ -0,0 +1,302 @@
+"""
+signals.bench == throughput and latency benchmarks for the signals package
+
+Run as `python -m signals.bench`; see `python -m signals.bench --help`.
+Every benchmark returns a JSON-serializable dict so results of two versions
+can be saved and compared.
+"""
+import functools
+import gc
+import platform
+import statistics
+import sys
+import time
+
+from .. import _signals as signals
+
+
+def _fresh_processor(workers: int, queue_type: type = signals.PriorityHeapQueue):
+    signals.shutdown()
+    return signals.getSignalProcessor(thread_ct=workers, queue_type=queue_type)
+
+
+def _make_slots(count: int) -> list:
+    """
+    Build distinct slot functions; the caller keeps them alive.
+    """
+    def make():
+        def slot(v):
+            pass
+        return slot
+    return [make() for _ in range(count)]
+
+
+def bench_emit_throughput(emissions: int = 20000, slot_counts=(1, 4, 16),
+                          typedef_counts=(1, 4), worker_counts=(1, 4, 10)) -> list:
+    """
+    Emissions per second from the first emit() until every slot has run,
+    across numbers of connected slots, signal typedefs and worker threads.
+    """
+    extra_types = [str, float, bytes, complex, list, dict, set]
+    results = []
+    for workers in worker_counts:
+        for typedef_ct in typedef_counts:
+            for slot_ct in slot_counts:
+                _fresh_processor(workers)
+                typedefs = [[int]] + [[t] for t in extra_types[:typedef_ct - 1]]
+                signal = signals.Signal(*typedefs)
+                slots = _make_slots(slot_ct)
+                for slot in slots:
+                    signal.connect(slot)
+
+                start = time.perf_counter()
+                for i in range(emissions):
+                    signal.emit(i)
+                emitted = time.perf_counter()
+                signals.join()
+                end = time.perf_counter()
+
+                results.append({
+                    'workers': workers,
+                    'typedefs': typedef_ct,
+                    'slots': slot_ct,
+                    'emissions': emissions,
+                    'emit_per_sec': emissions / (emitted - start),
+                    'delivered_per_sec': emissions * slot_ct / (end - start),
+                })
+    signals.shutdown()
+    return results
+
+
+def _percentiles(samples: list) -> dict:
+    samples = sorted(samples)
+    last = len(samples) - 1
+    return {
+        'p50_us': samples[last * 50 // 100] / 1e3,
+        'p90_us': samples[last * 90 // 100] / 1e3,
+        'p99_us': samples[last * 99 // 100] / 1e3,
+        'max_us': samples[last] / 1e3,
+        'mean_us': statistics.fmean(samples) / 1e3,
+    }
+
+
+def bench_latency(emissions: int = 5000, worker_counts=(1, 4, 10),
+                  interval: float = 0.0) -> list:
+    """
+    Latency percentiles from emit() until the slot starts running.
+
+    interval spaces emissions apart (seconds) to measure an unloaded pool;
+    0 measures latency under a burst.
+    """
+    results = []
+    for workers in worker_counts:
+        _fresh_processor(workers)
+        samples = []
+        clock = time.perf_counter_ns
+
+        def slot(sent: int):
+            samples.append(clock() - sent)
+
+        signal = signals.Signal([int])
+        signal.connect(slot)
+        for _ in range(emissions):
+            signal.emit(clock())
+            if interval:
+                time.sleep(interval)
+        signals.join()
+
+        result = {'workers': workers, 'emissions': emissions, 'interval': interval}
+        result.update(_percentiles(samples))
+        results.append(result)
+    signals.shutdown()
+    return results
+
+
+class _Receiver:
+
+    def slot(self, v):
+        pass
+
+
+def bench_connect_churn(cycles: int = 5000) -> list:
+    """
+    connect()/disconnect() rates for functions and bound methods, with a
+    compiled dispatch entry so connections also update it.
+
+    'pair' disconnects every slot right after connecting it; 'bulk' connects
+    all slots before disconnecting them, so costs growing with the number of
+    live connections show up. A shape the tree cannot handle reports an error.
+    """
+    results = []
+    for kind in ('function', 'method'):
+        for shape in ('pair', 'bulk'):
+            signal = signals.Signal([int])
+            signal.emit(0)  # compile a dispatch entry
+            if kind == 'function':
+                slots = _make_slots(cycles)
+            else:
+                receivers = [_Receiver() for _ in range(cycles)]
+                slots = [r.slot for r in receivers]
+
+            result = {'kind': kind, 'shape': shape, 'cycles': cycles}
+            try:
+                if shape == 'pair':
+                    start = time.perf_counter()
+                    for slot in slots:
+                        signal.connect(slot)
+                        signal.disconnect(slot)
+                    result['pairs_per_sec'] = cycles / (time.perf_counter() - start)
+                else:
+                    start = time.perf_counter()
+                    for slot in slots:
+                        signal.connect(slot)
+                    connected = time.perf_counter()
+                    for slot in slots:
+                        signal.disconnect(slot)
+                    end = time.perf_counter()
+                    result['connect_per_sec'] = cycles / (connected - start)
+                    result['disconnect_per_sec'] = cycles / (end - connected)
+            except Exception as e:
+                result['error'] = f'{type(e).__name__}: {e}'
+            results.append(result)
+    signals.shutdown()
+    return results
+
+
+def bench_factory_overhead(calls: int = 50000) -> list:
+    """
+    Per-call cost of a SignalFactory-decorated function over the plain function,
+    with no slots connected and with a slot on every signal.
+    """
+    def plain(a: int, b: str = 'x'):
+        return a
+
+    def listener(func, value):
+        pass
+
+    results = []
+    for connected in (False, True):
+        _fresh_processor(4)
+        decorated = signals.SignalFactory()(plain)
+        if connected:
+            decorated.onCall.connect(listener)
+            decorated.onComplete.connect(listener)
+
+        timings = {}
+        for name, func in (('plain', plain), ('decorated', decorated)):
+            start = time.perf_counter_ns()
+            for i in range(calls):
+                func(i, b='y')
+            timings[name] = (time.perf_counter_ns() - start) / calls
+        signals.join()
+        results.append({
+            'connected': connected,
+            'calls': calls,
+            'plain_ns': timings['plain'],
+            'decorated_ns': timings['decorated'],
+            'overhead_ns': timings['decorated'] - timings['plain'],
+        })
+    signals.shutdown()
+    return results
+
+
+def bench_cascade(emissions: int = 2000, fanout: int = 4, worker_counts=(4, 10)) -> list:
+    """
+    Deliveries per second through a cascading signal graph, whose slots emit
+    the next stage's signal from the worker: each emission fans out to fanout
+    slots, each of which emits once more, for each work queue type.
+    """
+    queue_types = (signals.PriorityHeapQueue, signals.PriorityLevelQueue,
+                   signals.WorkStealingQueue)
+    results = []
+    for workers in worker_counts:
+        for queue_type in queue_types:
+            _fresh_processor(workers, queue_type)
+            leaf = signals.Signal([int])
+            leaves = _make_slots(fanout)
+            for slot in leaves:
+                leaf.connect(slot)
+
+            def relay(v: int):
+                leaf.emit(v)
+
+            root = signals.Signal([int])
+            relays = [functools.partial(relay) for _ in range(fanout)]
+            for slot in relays:
+                root.connect(slot)
+
+            start = time.perf_counter()
+            for i in range(emissions):
+                root.emit(i)
+            signals.join()
+            end = time.perf_counter()
+
+            results.append({
+                'workers': workers,
+                'queue': queue_type.__name__,
+                'emissions': emissions,
+                'delivered_per_sec': emissions * fanout * (fanout + 1) / (end - start),
+            })
+    signals.shutdown()
+    return results
+
+
+# row keys describing a benchmark configuration rather than a measurement
+PARAMETERS = frozenset(('workers', 'typedefs', 'slots', 'emissions', 'interval',
+                        'kind', 'shape', 'cycles', 'calls', 'connected', 'queue'))
+
+BENCHMARKS = {
+    'emit_throughput': bench_emit_throughput,
+    'latency': bench_latency,
+    'connect_churn': bench_connect_churn,
+    'factory_overhead': bench_factory_overhead,
+    'cascade': bench_cascade,
+}
+
+
+def run(names=None, scale: float = 1.0) -> dict:
+    """
+    Run the named benchmarks (all by default) and return a JSON-serializable report.
+
+    scale multiplies every benchmark's iteration count.
+    """
+    from .. import __version__
+    defaults = {
+        'emit_throughput': {'emissions': 20000},
+        'latency': {'emissions': 5000},
+        'connect_churn': {'cycles': 5000},
+        'factory_overhead': {'calls': 50000},
+        'cascade': {'emissions': 2000},
+    }
+    report = {
+        'version': '.'.join(map(str, __version__)),
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': {},
+    }
+    for name in names or BENCHMARKS:
+        kwargs = {k: max(1, int(v * scale)) for k, v in defaults[name].items()}
+        gc.collect()
+        report['results'][name] = BENCHMARKS[name](**kwargs)
+    return report
+
+
+def compare(baseline: dict, current: dict) -> list:
+    """
+    Pair every numeric metric of matching benchmark rows, as
+    (benchmark, row parameters, metric, baseline value, current value, ratio).
+    """
+    rows = []
+    for name, current_rows in current['results'].items():
+        for base, cur in zip(baseline['results'].get(name, ()), current_rows):
+            params = {k: v for k, v in cur.items() if k in PARAMETERS}
+            if any(base.get(k) != v for k, v in params.items()):
+                continue
+            for metric, value in cur.items():
+                if metric in PARAMETERS:
+                    continue
+                if isinstance(value, float) and isinstance(base.get(metric), float):
+                    ratio = value / base[metric] if base[metric] else float('inf')
+                    rows.append((name, params, metric, base[metric], value, ratio))
+    return rows
@@ -0,0 +1,46 @@
+"""
+Command line entry point: python -m signals.bench [benchmark ...]
+"""
+import argparse
+import json
+import sys
+
+from . import BENCHMARKS, compare, run
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m signals.bench',
+        description='Measure signals emit/dispatch throughput and latency.')
+    parser.add_argument('benchmarks', nargs='*', metavar='BENCHMARK',
+                        help=f"benchmarks to run, any of {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='multiply every iteration count (e.g. 0.1 for a quick run)')
+    parser.add_argument('--output', '-o', help='write the JSON report to this file')
+    parser.add_argument('--compare', '-c', metavar='BASELINE',
+                        help='JSON report of a previous run to compare against')
+    args = parser.parse_args(argv)
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    report = run(args.benchmarks or None, scale=args.scale)
+    text = json.dumps(report, indent=4)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"\nversion {baseline.get('version')} -> {report['version']}", file=sys.stderr)
+        for name, params, metric, before, after, ratio in compare(baseline, report):
+            print(f'{name:<18} {json.dumps(params):<45} {metric:<20} '
+                  f'{before:>14.2f} {after:>14.2f} {ratio:>7.2f}x', file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import unittest
+
+from .. import _signals as signals
+from .._async import AsyncSignalProcessor
+
+
+class TestAsyncSignalProcessor(unittest.TestCase):
+
+    def tearDown(self):
+        signals.shutdown()
+
+    def test_emit_async(self):
+        calls = []
+
+        async def async_slot(v: int):
+            await asyncio.sleep(0)
+            calls.append(('async', v, threading.current_thread()))
+            return v * 2
+
+        def sync_slot(v: int):
+            calls.append(('sync', v, threading.current_thread()))
+            return v + 1
+
+        def failing_slot(v):
+            raise ValueError(v)
+
+        async def main():
+            signals.setSignalProcessor(AsyncSignalProcessor())
+            signal = signals.Signal([int])
+            signal.connect(async_slot)
+            signal.connect(sync_slot)
+            signal.connect(failing_slot)
+            results = await signal.emit_async(5)
+            await signals.getSignalProcessor().wait()
+            return results
+
+        results = asyncio.run(main())
+        # slot order follows connection storage, not connection order
+        self.assertEqual(sorted(r for r in results if isinstance(r, int)), [6, 10])
+        self.assertEqual(len([r for r in results if isinstance(r, ValueError)]), 1)
+        # every slot ran on the event loop's thread
+        self.assertTrue(all(c[2] is threading.current_thread() for c in calls))
+
+    def test_priority_order(self):
+        order = []
+
+        def slot(v: int):
+            order.append(v)
+
+        async def main():
+            processor = AsyncSignalProcessor()
+            signals.setSignalProcessor(processor)
+            low = signals.Signal([int], priority=signals.SignalPriority.LOW)
+            high = signals.Signal([int], priority=signals.SignalPriority.HIGH)
+            low.connect(slot)
+            high.connect(slot)
+            # nothing runs until the loop regains control, so these all queue up
+            low.emit(1)
+            low.emit(2)
+            high.emit(3)
+            await processor.wait()
+            self.assertRaises(RuntimeError, processor.join)
+
+        asyncio.run(main())
+        self.assertEqual(order, [3, 1, 2])
+
+    def test_emit_async_thread_pool(self):
+        def slot(v: int):
+            return v * 3
+
+        signal = signals.Signal([int])
+        signal.connect(slot)
+        self.assertEqual(asyncio.run(signal.emit_async(3)), [9])
@@ -0,0 +1,18 @@
+import json
+import unittest
+
+from .. import bench
+
+
+class TestBench(unittest.TestCase):
+
+    def test_report_round_trip(self):
+        report = bench.run(scale=0.001)
+        self.assertEqual(set(report['results']), set(bench.BENCHMARKS))
+        self.assertEqual(len(report['results']['emit_throughput']), 18)
+
+        # reports are plain JSON and compare against themselves at ratio 1
+        report = json.loads(json.dumps(report))
+        rows = bench.compare(report, report)
+        self.assertTrue(rows)
+        self.assertTrue(all(row[5] == 1 for row in rows if row[3]))
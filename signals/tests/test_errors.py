@@ -0,0 +1,90 @@
+import time
+import unittest
+
+from .. import _signals as signals
+from .._errors import ErrorReporter, RingBufferSink
+
+
+def failing_slot(v: int):
+    raise ValueError(f'bad value {v}')
+
+
+def other_failing_slot(v: int):
+    raise KeyError(v)
+
+
+class TestErrorReporter(unittest.TestCase):
+
+    def setUp(self):
+        self.sink = RingBufferSink()
+        self.previous = signals.setErrorReporter(
+            ErrorReporter(sinks=[self.sink], rate_limit=None, dedup_window=60))
+
+    def tearDown(self):
+        signals.shutdown()
+        reporter = signals.setErrorReporter(self.previous)
+        if reporter is not None:
+            reporter.close()
+
+    def test_deduplication(self):
+        signal = signals.Signal([int])
+        signal.connect(failing_slot)
+        signal.connect(other_failing_slot)
+        for i in range(50):
+            signal.emit(i)
+        signals.join()
+
+        records = self.sink.records()
+        by_type = {}
+        for record in records:
+            by_type.setdefault(record['type'], []).append(record)
+        # the first failure is reported at once, repeats are folded into one record
+        self.assertEqual(sorted(by_type), ['KeyError', 'ValueError'])
+        self.assertEqual([r['count'] for r in by_type['ValueError']], [1, 49])
+        self.assertEqual(sum(r['count'] for r in by_type['KeyError']), 50)
+
+        record = by_type['ValueError'][0]
+        self.assertEqual(record['trace'][-1]['name'], 'failing_slot')
+        self.assertTrue(record['message'].startswith('bad value'))
+        self.assertNotEqual(record['thread'], 'SignalErrorReporter')
+        self.assertIsInstance(record['exception'], ValueError)
+
+    def test_rate_limit(self):
+        reporter = ErrorReporter(sinks=[self.sink], rate_limit=5, dedup_window=0)
+        for i in range(20):
+            try:
+                raise ValueError(i)
+            except ValueError as e:
+                reporter.report(e)
+        reporter.close()
+        self.assertEqual(len(self.sink.records()), 5)
+        self.assertEqual(reporter.delivered, 5)
+        self.assertEqual(reporter.suppressed, 15)
+
+    def test_bounded_pending(self):
+        reporter = ErrorReporter(sinks=[lambda r: time.sleep(0.01)], max_pending=2,
+                                 rate_limit=None, dedup_window=0)
+        for i in range(20):
+            reporter.report(ValueError(i))
+        reporter.close()
+        self.assertGreater(reporter.dropped, 0)
+        self.assertEqual(reporter.delivered + reporter.dropped, 20)
+
+    def test_default_sinks(self):
+        signals.setErrorReporter(None).close()
+        received = []
+
+        def on_error(record: dict):
+            received.append(record)
+
+        signals.errorOccurred.connect(on_error)
+        signal = signals.Signal([int])
+        signal.connect(failing_slot)
+        with self.assertLogs('signals', 'ERROR') as logs:
+            signal.emit(1)
+            signals.join()
+        signals.join()
+        self.assertIn('ValueError: bad value 1', logs.output[0])
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0]['type'], 'ValueError')
+        signals.errorOccurred.disconnect(on_error)
@@ -1,3 +1,4 @@
+import inspect
 import unittest
 
 from .. import _signals as signals
@@ -62,11 +63,13 @@ class TestSignalFactory(unittest.TestCase):
         sample_function.onComplete.connect(onComplete)
 
         sample_function(5, var2="hello")
+        signals.join()
         self.assertTrue(flags[0], msg="onCall not called")
         self.assertTrue(flags[2], msg="onComplete not called")
 
         flags = [False]*3
         self.assertRaises(ValueError, sample_function, *(42, "blargh"))
+        signals.join()
         self.assertTrue(flags[1], msg="onError not called")
 
     def test_bound_method_decoration(self):
@@ -123,14 +126,64 @@ class TestSignalFactory(unittest.TestCase):
         t.sample_method.onComplete.connect(onComplete)
 
         t.sample_method(8, "bueno")
+        signals.join()
         self.assertTrue(flags[0], msg="onCall not called")
         self.assertTrue(flags[2], msg="onComplete not called")
 
         flags = [False]*3
         self.assertRaises(ValueError, t.sample_method, *(42, "blargh"))
+        signals.join()
         self.assertTrue(flags[1], msg="onError not called")
 
         flags = [False]*3
         t.sample_cm.onCall.connect(onCall)
 
         t.sample_cm(1, "abc")
+
+    def test_argument_packer(self):
+        def positional(a, b=2, /, c=3, d=4):
+            pass
+
+        def variadic(a, *args, key=1, **kwargs):
+            pass
+
+        calls = [
+            (positional, (1,), {}),
+            (positional, (1, 5, 6, 7), {}),
+            (positional, (1,), {'d': 9}),
+            (positional, (1, 2), {'d': 9, 'c': 8}),
+            (variadic, (1, 2, 3), {'key': 4, 'extra': 5}),
+        ]
+        for func, args, kwargs in calls:
+            sig = inspect.signature(func)
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            expected = tuple(bound.arguments.values())
+            pack = signals._compileArgumentPacker(sig)
+            self.assertEqual(pack(args, kwargs), expected, msg=(func, args, kwargs))
+
+        pack = signals._compileArgumentPacker(inspect.signature(positional))
+        self.assertRaises(TypeError, pack, (), {})
+        self.assertRaises(TypeError, pack, (1,), {'b': 2})
+        self.assertRaises(TypeError, pack, (1, 2, 3), {'c': 3})
+
+    def test_unconnected_signals_skip_emission(self):
+        packed = []
+
+        @signals.SignalFactory()
+        def sample_func(var1: int, var2: str = "x"):
+            return var1
+
+        # nothing connected: arguments are never packed nor emitted
+        original = sample_func.onCall.emit
+        sample_func.onCall.emit = lambda *args: packed.append(args)
+        self.assertEqual(sample_func(1), 1)
+        self.assertEqual(packed, [])
+
+        def onCall(func, args):
+            pass
+
+        sample_func.onCall.connect(onCall)
+        sample_func(1)
+        self.assertEqual(packed, [(sample_func.__wrapped__, (1, "x"))])
+        sample_func.onCall.emit = original
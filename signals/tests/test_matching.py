@@ -0,0 +1,149 @@
+import abc
+import collections.abc
+import gc
+import sys
+import typing
+import unittest
+import weakref
+
+from .. import _signals as signals
+from .._matching import ANY, distance, normalize
+
+
+class Shape(abc.ABC):
+    pass
+
+
+class Square:
+    pass
+
+
+Shape.register(Square)
+
+
+@typing.runtime_checkable
+class Closable(typing.Protocol):
+    def close(self): ...
+
+
+class Resource:
+    def close(self):
+        pass
+
+
+class Unchecked(typing.Protocol):
+    def run(self): ...
+
+
+T = typing.TypeVar('T', bound=int)
+
+# X | Y unions only exist from Python 3.10
+OptionalInt = int | None if sys.version_info >= (3, 10) else typing.Optional[int]
+
+
+class TestNormalize(unittest.TestCase):
+
+    def test_normalize(self):
+        self.assertEqual(normalize(int), (int,))
+        self.assertEqual(normalize(None), (type(None),))
+        self.assertEqual(normalize(OptionalInt), (int, type(None)))
+        self.assertEqual(normalize(typing.Optional[str]), (str, type(None)))
+        self.assertEqual(normalize(typing.Union[int, str, int]), (int, str))
+        self.assertEqual(normalize(typing.Union[int, typing.Any]), ANY)
+        self.assertEqual(normalize(list[int]), (list,))
+        self.assertEqual(normalize(typing.Dict[str, int]), (dict,))
+        self.assertEqual(normalize(typing.Iterable), (collections.abc.Iterable,))
+        self.assertEqual(normalize(typing.Callable[[int], str]), (collections.abc.Callable,))
+        self.assertEqual(normalize(typing.Literal['a', 1]), (str, int))
+        self.assertEqual(normalize(typing.Annotated[float, 'metres']), (float,))
+        self.assertEqual(normalize(T), (int,))
+        self.assertEqual(normalize(Unchecked), ANY)
+        self.assertEqual(normalize('NotResolved'), ANY)
+
+    def test_distance(self):
+        self.assertEqual(distance(bool, int), 1)
+        self.assertEqual(distance(int, str), -1)
+        # virtual subclasses match, as far away as object
+        self.assertEqual(distance(Square, Shape), distance(Square, object))
+        self.assertGreaterEqual(distance(Resource, Closable), 0)
+        self.assertGreaterEqual(distance(list, collections.abc.Iterable), 0)
+
+
+class TestTypedMatching(unittest.TestCase):
+
+    def tearDown(self):
+        signals.shutdown()
+
+    def test_typed_slots(self):
+        received = []
+
+        def optional(v: OptionalInt):
+            received.append(('optional', v))
+
+        def generic(v: list[int]):
+            received.append(('generic', v))
+
+        def shape(v: Shape):
+            received.append(('shape', v))
+
+        def closable(v: Closable):
+            received.append(('closable', v))
+
+        def forward(v: 'int'):
+            received.append(('forward', v))
+
+        signal = signals.Signal([object])
+        for slot in (optional, generic, shape, closable, forward):
+            signal.connect(slot)
+
+        square, resource = Square(), Resource()
+        for v in (1, None, [1, 2], square, resource, 'text'):
+            signal.emit(v)
+        signals.join()
+        self.assertEqual(sorted((name, repr(v)) for name, v in received), sorted([
+            ('optional', '1'), ('optional', 'None'), ('generic', '[1, 2]'),
+            ('shape', repr(square)), ('closable', repr(resource)), ('forward', '1')]))
+
+    def test_typed_signal(self):
+        received = []
+
+        def on_value(v: int):
+            received.append(v)
+
+        def on_items(items: typing.Iterable):
+            received.append(tuple(items))
+
+        values = signals.Signal([typing.Optional[int]])
+        values.connect(on_value)
+        self.assertEqual(values._connections[id(on_value)].typedefs,
+                         ((typing.Optional[int],),))
+        values.emit(3)
+        values.emit(None)
+        values.emit('x')
+
+        items = signals.Signal([typing.Iterable])
+        items.connect(on_items)
+        items.emit([1])
+        items.emit((2,))
+        items.emit(3)
+        signals.join()
+        self.assertEqual(sorted(received, key=str), [(1,), (2,), 3])
+
+    def test_dynamic_classes_released(self):
+        # distances are memoized per signal, so a dropped signal pins no emitted class
+        received = []
+
+        def shape(v: Shape):
+            received.append(v)
+
+        signal = signals.Signal([object])
+        signal.connect(shape)
+        dynamic = type('Dynamic', (Square,), {})
+        signal.emit(dynamic())
+        signals.join()
+        self.assertEqual(len(received), 1)
+
+        ref = weakref.ref(dynamic)
+        del signal, dynamic, received[:]
+        gc.collect()
+        self.assertIsNone(ref())
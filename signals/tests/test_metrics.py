@@ -0,0 +1,104 @@
+import threading
+import time
+import unittest
+
+from .. import _signals as signals
+
+
+def metered_slot(v: int):
+    time.sleep(0.001)
+
+
+class TestMetrics(unittest.TestCase):
+
+    def tearDown(self):
+        signals.disableMetrics()
+        signals.shutdown()
+
+    def test_snapshot(self):
+        self.assertIsNone(signals.metricsSnapshot())
+        signals.getSignalProcessor(thread_ct=2, queue_type=signals.PriorityLevelQueue)
+        signals.enableMetrics()
+
+        signal = signals.Signal([int], name='ticks', priority=signals.SignalPriority.HIGH)
+        signal.connect(metered_slot)
+        for i in range(20):
+            signal.emit(i)
+        signal.emit_many([(i,) for i in range(5)])
+        snapshot = signals.metricsSnapshot()
+        self.assertIn(signals.SignalPriority.HIGH, snapshot['queue_depth'])
+        signals.join()
+
+        snapshot = signals.metricsSnapshot()
+        self.assertEqual(snapshot['tasks'], 21)
+        stats = snapshot['signals']['ticks']
+        self.assertEqual(stats['run_time']['count'], 21)
+        self.assertGreaterEqual(stats['run_time']['max_us'], 1000)
+        self.assertLessEqual(stats['run_time']['p50_us'], stats['run_time']['max_us'])
+        self.assertGreater(stats['queue_wait']['max_us'], 0)
+        self.assertIn('metered_slot', snapshot['slots'])
+        self.assertEqual(snapshot['workers']['count'], 2)
+        self.assertGreater(snapshot['workers']['utilization'], 0)
+        self.assertEqual(snapshot['queue_depth'], {})
+
+        signals.disableMetrics()
+        self.assertIsNone(signals.metricsSnapshot())
+
+    def test_wrapped_slots(self):
+        # serial, keyed and coalesced slots are labelled by the slot, not their runner
+        signals.enableMetrics()
+
+        def serial_slot(v: int):
+            pass
+
+        def keyed_slot(v: int):
+            pass
+
+        def coalesced_slot(v: int):
+            pass
+
+        serial = signals.Signal([int])
+        serial.connect(serial_slot, serial=True)
+        keyed = signals.Signal([int], key=lambda v: v % 2)
+        keyed.connect(keyed_slot)
+        coalesced = signals.Signal([int], coalesce=True)
+        coalesced.connect(coalesced_slot)
+        for i in range(4):
+            serial.emit(i)
+            keyed.emit(i)
+            coalesced.emit(i)
+        signals.join()
+
+        slots = {name.rsplit('.', 1)[-1] for name in signals.metricsSnapshot()['slots']}
+        self.assertEqual(slots, {'serial_slot', 'keyed_slot', 'coalesced_slot'})
+
+    def test_buffered_records(self):
+        # records past the fold threshold land in the table, the rest in the buffer
+        metrics = signals.SignalMetrics()
+        now = time.perf_counter_ns()
+        for i in range(600):
+            metrics.record('ticks', 'slot_a' if i % 3 else 'slot_b', now, now + 1000, now + 3000)
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot['tasks'], 600)
+        self.assertEqual(snapshot['slots']['slot_a']['run_time']['count'], 400)
+        self.assertEqual(snapshot['slots']['slot_b']['queue_wait']['count'], 200)
+        self.assertEqual(metrics.snapshot()['tasks'], 600)
+
+    def test_exited_threads(self):
+        # the recorders of exited threads are merged, not kept one per thread
+        metrics = signals.SignalMetrics()
+        now = time.perf_counter_ns()
+
+        def record(count):
+            for _ in range(count):
+                metrics.record('ticks', 'slot_a', now, now + 1000, now + 3000)
+
+        for count in (10, 300, 5):
+            t = threading.Thread(target=record, args=(count,))
+            t.start()
+            t.join()
+        record(1)
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot['tasks'], 316)
+        self.assertEqual(snapshot['slots']['slot_a']['run_time']['count'], 316)
+        self.assertEqual(len(metrics._recorders), 1)
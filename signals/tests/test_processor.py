@@ -0,0 +1,555 @@
+import asyncio
+import os
+import queue
+import threading
+import time
+import unittest
+
+from .. import _signals as signals
+
+
+class _Item:
+
+    def __init__(self, priority, name):
+        self.priority = priority
+        self.name = name
+
+
+class TestPriorityLevelQueue(unittest.TestCase):
+
+    def test_ordering(self):
+        q = signals.PriorityLevelQueue()
+        items = [_Item(signals.SignalPriority.LOW, 'low1'),
+                 _Item(signals.SignalPriority.HIGH, 'high1'),
+                 _Item(signals.SignalPriority.LOW, 'low2'),
+                 _Item(signals.SignalPriority.IMMEDIATE, 'now'),
+                 _Item(signals.SignalPriority.HIGH, 'high2'),
+                 _Item(2**62, 'sentinel')]
+        for item in items:
+            q.put(item)
+        self.assertEqual(q.qsize(), len(items))
+
+        # most urgent level first, FIFO within a level, out-of-range last
+        names = [q.get_nowait().name for _ in items]
+        self.assertEqual(names, ['now', 'high1', 'high2', 'low1', 'low2', 'sentinel'])
+        self.assertTrue(q.empty())
+        self.assertEqual(q._bitmap, 0)
+
+
+class TestPriorityThreadPoolExecutor(unittest.TestCase):
+
+    def tearDown(self):
+        signals.shutdown()
+
+    def test_level_queue_processor(self):
+        processor = signals.getSignalProcessor(
+            thread_ct=4, queue_type=signals.PriorityLevelQueue)
+        self.assertIsInstance(processor._work_queue, signals.PriorityLevelQueue)
+
+        lock = threading.Lock()
+        results = []
+
+        def slot(v: int):
+            with lock:
+                results.append(v)
+
+        signal = signals.Signal([int])
+        signal.connect(slot)
+        for i in range(50):
+            signal.emit(i)
+        signals.join()
+        self.assertEqual(sorted(results), list(range(50)))
+
+    def test_fifo_within_priority(self):
+        for queue_type in (queue.PriorityQueue, signals.PriorityLevelQueue,
+                           signals.WorkStealingQueue):
+            processor = signals.PriorityThreadPoolExecutor(
+                queue_type=queue_type, max_workers=1)
+            gate = threading.Event()
+            order = []
+
+            # hold the only worker so everything below queues up behind it
+            processor.submit(gate.wait)
+            for i in range(20):
+                processor.submit(order.append, ('low', i),
+                                 priority=signals.SignalPriority.LOW)
+                processor.submit(order.append, ('high', i),
+                                 priority=signals.SignalPriority.HIGH)
+            gate.set()
+            processor.shutdown(wait=True)
+
+            expected = [('high', i) for i in range(20)] + [('low', i) for i in range(20)]
+            self.assertEqual(order, expected, msg=queue_type.__name__)
+
+    def test_work_stealing(self):
+        processor = signals.PriorityThreadPoolExecutor(
+            queue_type=signals.WorkStealingQueue, max_workers=2)
+        processor.prestart()
+        work_queue = processor._work_queue
+        barrier = threading.Barrier(2, timeout=5)
+        threads = []
+
+        def child():
+            threads.append(threading.current_thread())
+            barrier.wait()
+
+        def root():
+            # queued on this worker's own heap; the idle worker steals one
+            processor.submit(child)
+            processor.submit(child)
+            threads.append(threading.current_thread())
+
+        processor.submit(root)
+        processor.join()
+        self.assertEqual(len(set(threads)), 2)
+        self.assertEqual(work_queue.stolen, 1)
+        self.assertEqual(work_queue.qsize(), 0)
+
+        # priority holds between a worker's own heap and the shared one
+        order = []
+        queued = threading.Event()
+        gate = threading.Event()
+
+        def cascade():
+            for i in range(3):
+                processor.submit(order.append, ('low', i), priority=signals.SignalPriority.LOW)
+            queued.set()
+            gate.wait()
+
+        processor.resize(max_workers=1)
+        processor.join()
+        processor.submit(cascade)
+        self.assertTrue(queued.wait(5))
+        processor.submit(order.append, ('high', 0), priority=signals.SignalPriority.HIGH)
+        self.assertEqual(work_queue.depths(),
+                         {signals.SignalPriority.LOW: 3, signals.SignalPriority.HIGH: 1})
+        gate.set()
+        processor.join()
+        self.assertEqual(order, [('high', 0), ('low', 0), ('low', 1), ('low', 2)])
+        processor.shutdown(wait=True)
+
+    def test_post(self):
+        from .._errors import ErrorReporter, RingBufferSink
+        sink = RingBufferSink()
+        previous = signals.setErrorReporter(ErrorReporter(sinks=[sink], dedup_window=0))
+        processor = signals.PriorityThreadPoolExecutor(max_workers=1)
+        gate = threading.Event()
+        order = []
+
+        def fail():
+            raise ValueError('posted')
+
+        processor.submit(gate.wait)
+        self.assertTrue(processor.post(order.append, 'low', priority=signals.SignalPriority.LOW))
+        self.assertTrue(processor.post(fail))
+        self.assertTrue(processor.post(order.append, 'high', priority=signals.SignalPriority.HIGH))
+        self.assertIsInstance(processor._work_queue.queue[0], signals.PostedWorkItem)
+        gate.set()
+        processor.join()
+        self.assertEqual(order, ['high', 'low'])
+        signals.setErrorReporter(previous).close()
+        self.assertEqual([r['message'] for r in sink.records()], ['posted'])
+
+        # dropped posts have no future to cancel
+        processor.shutdown(wait=True)
+        processor, gate = self._gated(signals.OverflowPolicy.DROP_OLDEST)
+        processor.post(int, priority=signals.SignalPriority.LOW)
+        processor.post(int, priority=signals.SignalPriority.LOW)
+        self.assertTrue(processor.post(int, priority=signals.SignalPriority.HIGH))
+        self.assertFalse(processor.post(int, priority=signals.SignalPriority.NONE))
+        self.assertEqual(processor.dropped, 2)
+        gate.set()
+        processor.shutdown(wait=True)
+        self.assertRaises(RuntimeError, processor.post, int)
+
+    def _gated(self, overflow, queue_type=signals.PriorityLevelQueue):
+        # single worker held on a gate, so submissions accumulate in a queue of two
+        processor = signals.PriorityThreadPoolExecutor(
+            queue_type=queue_type, max_queue=2, overflow=overflow, max_workers=1)
+        gate = threading.Event()
+        started = threading.Event()
+        processor.submit(lambda: (started.set(), gate.wait()))
+        started.wait()
+        return processor, gate
+
+    def test_overflow_drop_newest(self):
+        processor, gate = self._gated(signals.OverflowPolicy.DROP_NEWEST)
+        kept = [processor.submit(int) for _ in range(2)]
+        dropped = processor.submit(int)
+        self.assertTrue(dropped.cancelled())
+        self.assertEqual(processor.dropped, 1)
+        gate.set()
+        processor.shutdown(wait=True)
+        self.assertTrue(all(f.done() and not f.cancelled() for f in kept))
+
+    def test_overflow_drop_oldest(self):
+        for queue_type in (signals.PriorityHeapQueue, signals.PriorityLevelQueue):
+            processor, gate = self._gated(signals.OverflowPolicy.DROP_OLDEST, queue_type)
+            low1 = processor.submit(int, priority=signals.SignalPriority.LOW)
+            low2 = processor.submit(int, priority=signals.SignalPriority.LOW)
+            high = processor.submit(int, priority=signals.SignalPriority.HIGH)
+            # the oldest of the least urgent items made room
+            self.assertTrue(low1.cancelled())
+            # a submission less urgent than everything queued is dropped itself
+            none = processor.submit(int, priority=signals.SignalPriority.NONE)
+            self.assertTrue(none.cancelled())
+            self.assertEqual(processor.dropped, 2)
+            gate.set()
+            processor.shutdown(wait=True)
+            self.assertEqual(high.result(), 0)
+            self.assertEqual(low2.result(), 0)
+
+        self.assertRaises(TypeError, signals.PriorityThreadPoolExecutor,
+                          queue_type=queue.PriorityQueue,
+                          overflow=signals.OverflowPolicy.DROP_OLDEST)
+
+    def test_overflow_raise(self):
+        processor, gate = self._gated(signals.OverflowPolicy.RAISE)
+        processor.submit(int)
+        processor.submit(int)
+        self.assertRaises(queue.Full, processor.submit, int)
+        self.assertEqual(processor.dropped, 1)
+        gate.set()
+        processor.shutdown(wait=True)
+
+    def test_overflow_block(self):
+        processor, gate = self._gated(signals.OverflowPolicy.BLOCK)
+        processor.submit(int)
+        processor.submit(int)
+        submitted = threading.Event()
+
+        def submit():
+            processor.submit(int)
+            submitted.set()
+
+        t = threading.Thread(target=submit)
+        t.start()
+        self.assertFalse(submitted.wait(0.05))
+        gate.set()
+        self.assertTrue(submitted.wait(5))
+        t.join()
+        self.assertEqual(processor.blocked, 1)
+        processor._work_queue.join()
+        processor.shutdown(wait=True)
+
+    def test_overflow_block_cascade(self):
+        # a blocked emitter must not keep workers from emitting into the full queue
+        signals.getSignalProcessor(thread_ct=1, max_queue=2)
+        received = []
+        inner = signals.Signal([int])
+        outer = signals.Signal([int])
+
+        def collect(v: int):
+            received.append(v)
+
+        inner.connect(collect)
+
+        def relay(v: int):
+            inner.emit(v)
+
+        outer.connect(relay)
+        t = threading.Thread(target=lambda: [outer.emit(i) for i in range(20)])
+        t.start()
+        t.join(5)
+        self.assertFalse(t.is_alive())
+        signals.join()
+        self.assertEqual(sorted(received), list(range(20)))
+
+    def test_shutdown_wakes_blocked(self):
+        processor, gate = self._gated(signals.OverflowPolicy.BLOCK)
+        processor.submit(int)
+        processor.submit(int)
+        errors = []
+
+        def submit():
+            try:
+                processor.submit(int)
+            except RuntimeError as e:
+                errors.append(e)
+
+        t = threading.Thread(target=submit)
+        t.start()
+        time.sleep(0.05)
+        processor.shutdown(wait=False)
+        t.join(5)
+        self.assertFalse(t.is_alive())
+        self.assertEqual(len(errors), 1)
+        gate.set()
+
+    def test_bound_existing(self):
+        # the first emission builds the default processor unbounded
+        def slot(v: int):
+            pass
+
+        signal = signals.Signal([int])
+        signal.connect(slot)
+        signal.emit(1)
+        processor = signals.getSignalProcessor(
+            max_queue=5, overflow=signals.OverflowPolicy.RAISE, idle_timeout=None)
+        self.assertEqual(processor._work_queue.maxsize, 5)
+        self.assertEqual(processor._overflow, signals.OverflowPolicy.RAISE)
+        self.assertEqual(processor._idle_timeout, [None])
+        with self.assertRaises(ValueError):
+            signals.getSignalProcessor(queue_type=signals.WorkStealingQueue)
+        with self.assertRaises(ValueError):
+            processor.bound(overflow='drop_everything')
+        signals.shutdown()
+
+        # raising the bound releases a submission blocked on it
+        processor, gate = self._gated(signals.OverflowPolicy.BLOCK)
+        processor.submit(int)
+        processor.submit(int)
+        t = threading.Thread(target=processor.submit, args=(int,))
+        t.start()
+        time.sleep(0.05)
+        self.assertTrue(t.is_alive())
+        processor.bound(max_queue=0)
+        t.join(5)
+        self.assertFalse(t.is_alive())
+        gate.set()
+        processor.shutdown(wait=True)
+
+
+class TestAutoscaling(unittest.TestCase):
+
+    def _wait_for(self, predicate, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def test_idle_reaping(self):
+        processor = signals.PriorityThreadPoolExecutor(
+            max_workers=4, min_workers=1, idle_timeout=0.05)
+        # min_workers start with the pool
+        self.assertEqual(processor.stats()['workers'], 1)
+
+        gate = threading.Event()
+        for _ in range(4):
+            processor.submit(gate.wait)
+        self.assertEqual(processor.stats()['workers'], 4)
+        gate.set()
+        processor.join()
+
+        # idle workers retire down to min_workers
+        self.assertTrue(self._wait_for(lambda: processor.stats()['workers'] == 1))
+        time.sleep(0.1)
+        self.assertEqual(processor.stats()['workers'], 1)
+        self.assertEqual(processor.submit(lambda: 3).result(5), 3)
+        processor.shutdown(wait=True)
+
+    def test_submit_after_reaping(self):
+        processor = signals.PriorityThreadPoolExecutor(max_workers=1, idle_timeout=0.05)
+        futures = [processor.submit(lambda i=i: i) for i in range(200)]
+        self.assertEqual([f.result(5) for f in futures], list(range(200)))
+        self.assertTrue(self._wait_for(lambda: processor.stats()['workers'] == 0))
+        self.assertEqual(processor._idle_workers, [0, 0])
+        # the burst left no idle worker behind that the next submission could count on
+        self.assertEqual(processor.submit(lambda: 'again').result(5), 'again')
+        processor.shutdown(wait=True)
+
+    def test_regrow_after_reaping(self):
+        processor = signals.PriorityThreadPoolExecutor(
+            max_workers=4, min_workers=1, idle_timeout=0.1)
+        for _ in range(2):
+            futures = [processor.submit(lambda i=i: i) for i in range(50)]
+            self.assertEqual([f.result(5) for f in futures], list(range(50)))
+            self.assertTrue(self._wait_for(lambda: processor.stats()['workers'] == 1))
+
+        # the pool grows again once both tasks need a worker at the same time
+        barrier = threading.Barrier(2, timeout=5)
+        futures = [processor.submit(barrier.wait) for _ in range(2)]
+        self.assertEqual(sorted(f.result(5) for f in futures), [0, 1])
+        self.assertEqual(processor.stats()['workers'], 2)
+        processor.shutdown(wait=True)
+
+    def test_resize(self):
+        processor = signals.PriorityThreadPoolExecutor(max_workers=2)
+        with self.assertRaises(ValueError):
+            processor.resize(max_workers=0)
+        with self.assertRaises(ValueError):
+            processor.resize(min_workers=3)
+
+        processor.resize(max_workers=6, min_workers=3)
+        self.assertEqual(processor.stats()['workers'], 3)
+        self.assertEqual(processor.stats()['max_workers'], 6)
+
+        gate = threading.Event()
+        for _ in range(6):
+            processor.submit(gate.wait)
+        self.assertEqual(processor.stats()['workers'], 6)
+
+        # surplus workers retire once they are done with their current work
+        processor.resize(max_workers=2, min_workers=0)
+        self.assertEqual(processor.stats()['workers'], 6)
+        gate.set()
+        self.assertTrue(self._wait_for(lambda: processor.stats()['workers'] == 2))
+        results = [processor.submit(lambda i=i: i) for i in range(10)]
+        self.assertEqual([f.result(5) for f in results], list(range(10)))
+        processor.shutdown(wait=True)
+
+    def test_idle_reuse(self):
+        processor = signals.PriorityThreadPoolExecutor(max_workers=4)
+        for i in range(20):
+            self.assertEqual(processor.submit(lambda i=i: i).result(5), i)
+            self.assertTrue(self._wait_for(lambda: processor._idle_workers == [1, 0]))
+        # each submission found the first worker idle
+        self.assertEqual(processor.stats()['workers'], 1)
+
+        self.assertEqual(processor.prestart(3), 2)
+        self.assertEqual(processor.prestart(), 1)
+        names = set()
+        barrier = threading.Barrier(4, timeout=5)
+
+        def busy():
+            names.add(threading.current_thread().name)
+            barrier.wait()
+
+        futures = [processor.submit(busy) for _ in range(4)]
+        for f in futures:
+            f.result(5)
+        self.assertEqual(len(names), 4)
+        self.assertEqual(processor.stats()['workers'], 4)
+        processor.shutdown(wait=True)
+
+    def test_get_signal_processor_resizes(self):
+        processor = signals.getSignalProcessor(thread_ct=2, name='scaling')
+        self.assertIs(signals.getSignalProcessor(thread_ct=5, min_workers=1, name='scaling'),
+                      processor)
+        stats = signals.processorStats()['scaling']
+        self.assertEqual((stats['min_workers'], stats['max_workers']), (1, 5))
+        self.assertEqual(stats['workers'], 1)
+        signals.getSignalProcessor(name='scaling', prestart=3)
+        self.assertEqual(signals.processorStats()['scaling']['workers'], 3)
+        signals.shutdown()
+
+    def test_scale_up_thresholds(self):
+        processor = signals.getSignalProcessor(
+            thread_ct=4, name='thresholds', idle_timeout=None, scale_up_depth=3)
+        stats = processor.stats()
+        self.assertEqual((stats['scale_up_depth'], stats['scale_up_wait']), (3, None))
+
+        gate = threading.Event()
+        processor.submit(gate.wait)
+        processor.submit(gate.wait)
+        # the second item is queued behind the busy worker, below the depth
+        self.assertEqual(processor.stats()['workers'], 1)
+
+        # enabling scale_up_wait on a running pool starts a worker for the stalled queue
+        self.assertIs(signals.getSignalProcessor(name='thresholds', scale_up_wait=0.05),
+                      processor)
+        self.assertEqual(processor.stats()['scale_up_wait'], 0.05)
+        time.sleep(0.1)
+        processor.submit(gate.wait)
+        self.assertEqual(processor.stats()['workers'], 2)
+
+        processor.resize(scale_up_depth=1, scale_up_wait=None)
+        stats = processor.stats()
+        self.assertEqual((stats['scale_up_depth'], stats['scale_up_wait']), (1, None))
+        with self.assertRaises(ValueError):
+            processor.resize(scale_up_depth=0)
+        gate.set()
+        signals.shutdown('thresholds')
+
+
+class TestNamedProcessors(unittest.TestCase):
+
+    def tearDown(self):
+        signals.shutdown()
+
+    def test_isolation(self):
+        io = signals.getSignalProcessor(thread_ct=1, name='io')
+        self.assertIs(signals.getSignalProcessor(name='io'), io)
+        self.assertIsNot(signals.getSignalProcessor(), io)
+
+        gate = threading.Event()
+        threads = {}
+
+        def slow(v: int):
+            threads['slow'] = threading.current_thread()
+            gate.wait()
+
+        def fast(v: int):
+            threads['fast'] = threading.current_thread()
+
+        def cascade(v: int):
+            threads['cascade'] = threading.current_thread()
+
+        slow_signal = signals.Signal([int], processor='io')
+        fast_signal = signals.Signal([int])
+        auto_signal = signals.Signal([int], dispatch=signals.DispatchMode.AUTO, processor='io')
+        slow_signal.connect(slow)
+        fast_signal.connect(fast)
+        auto_signal.connect(cascade)
+
+        slow_signal.emit(1)
+        slow_signal.emit(2)
+        # the default processor is not held up by the blocked io worker
+        fast_signal.emit(1)
+        signals.join(signals.DEFAULT_PROCESSOR)
+        self.assertTrue(threads['fast'].name.startswith('SignalProcessor_'))
+        stats = signals.processorStats()
+        self.assertEqual(stats['io']['workers'], 1)
+        self.assertEqual(stats['io']['queued'], 1)
+
+        # AUTO runs directly only on a worker of the signal's own processor
+        def relay(v: int):
+            auto_signal.emit(v)
+
+        fast_signal.connect(relay)
+        fast_signal.emit(2)
+        signals.join(signals.DEFAULT_PROCESSOR)
+        self.assertNotIn('cascade', threads)
+
+        gate.set()
+        signals.join()
+        self.assertTrue(threads['slow'].name.startswith('SignalProcessor-io'))
+        self.assertIs(threads['cascade'], threads['slow'])
+
+        signals.shutdown('io')
+        self.assertNotIn('io', signals.processorStats())
+        self.assertIn(signals.DEFAULT_PROCESSOR, signals.processorStats())
+
+
+def process_slot(v: int):
+    return v * v, os.getpid()
+
+
+class TestPriorityProcessPoolExecutor(unittest.TestCase):
+
+    def tearDown(self):
+        signals.shutdown()
+
+    def test_process_dispatch(self):
+        signals.getProcessProcessor(worker_ct=2)
+        self.assertIs(signals.getProcessProcessor(), signals.getProcessProcessor(worker_ct=2))
+        self.assertRaises(ValueError, signals.getProcessProcessor, worker_ct=3)
+        signal = signals.Signal([int])
+        signal.connect(process_slot, dispatch=signals.DispatchMode.PROCESS)
+
+        (result, pid), = asyncio.run(signal.emit_async(7))
+        self.assertEqual(result, 49)
+        self.assertNotEqual(pid, os.getpid())
+
+        # batches run in a single worker process
+        futures = signal.emit_many([(1,), (2,)], futures=True)
+        self.assertEqual(len(futures), 1)
+        self.assertIsNone(futures[0].result(timeout=10))
+
+        self.assertRaises(TypeError, signal.connect, lambda v: v,
+                          dispatch=signals.DispatchMode.PROCESS)
+
+    def test_priority_order(self):
+        processor = signals.PriorityProcessPoolExecutor(max_workers=1)
+        gate = processor.submit(time.sleep, 0.2)
+        futures = [processor.submit(time.monotonic, priority=p)
+                   for p in (signals.SignalPriority.LOW, signals.SignalPriority.HIGH,
+                             signals.SignalPriority.IMMEDIATE)]
+        processor.join()
+        self.assertIsNone(gate.result())
+        low, high, immediate = (f.result() for f in futures)
+        self.assertLess(immediate, high)
+        self.assertLess(high, low)
+        processor.shutdown(wait=True)
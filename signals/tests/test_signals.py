@@ -1,3 +1,6 @@
+import asyncio
+import threading
+import time
 import unittest
 from .. import _signals as signals
 
@@ -136,20 +139,168 @@ class TestSignal(unittest.TestCase):
         self.assertRaises(TypeError, self.signal._similarity,
                           [int, object, str])
 
-    # def test_weakref_cleanup(self):
-    #     """
-    #     FIXME: this function doesn't seem to work correctly; WeakMethod becomes dead
-    #            but doesn't seem to get cleaned up correctly, so it lingers.
-    #            Need to verify whether this is actually a bug, or expected behavior
-    #            limited by the test case.
-    #     """
-    #     tf = TestFuncs()
-    #     self.signal.connect(func_w_typing)
-    #     self.signal.connect(tf.method_w_typing)
-
-    #     self.assertEqual(len(self.signal.slots((int, str))), 2)
-    #     del tf
-    #     self.assertEqual(len(self.signal.slots((int, str))), 1)  # error: still shows 2
+    def test_similarity_cache(self):
+        self.signal.cache_clear()
+        self.signal._similarity((int, str))
+        self.signal._similarity((int, str))
+        info = self.signal.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+        # caches are per signal, and connecting does not invalidate them
+        other = signals.Signal([int, str])
+        other._similarity((int, str))
+        self.signal.connect(func_w_typing)
+        self.assertEqual(self.signal.cache_info().currsize, 1)
+        self.assertEqual(other.cache_info().misses, 1)
+
+    def test_similarity_cache_eviction(self):
+        lru = signals.Signal([int], cache_size=2, cache_policy='lru')
+        lru._similarity((int,))
+        lru._similarity((bool,))
+        lru._similarity((int,))
+        lru._similarity((str,))  # evicts (bool,), the least recently used
+        self.assertEqual(set(lru._similarity_cache._data), {(int,), (str,)})
+
+        lfu = signals.Signal([int], cache_size=2, cache_policy='lfu')
+        lfu._similarity((int,))
+        lfu._similarity((bool,))
+        lfu._similarity((bool,))
+        lfu._similarity((int,))
+        lfu._similarity((bool,))
+        lfu._similarity((str,))  # evicts (int,), the least frequently used
+        self.assertEqual(set(lfu._similarity_cache._data), {(bool,), (str,)})
+
+        self.assertRaises(ValueError, signals.Signal, [int], cache_policy='fifo')
+
+    def test_weakref_cleanup(self):
+        tf = TestFuncs()
+        self.signal.connect(func_w_typing)
+        self.signal.connect(tf.method_w_typing)
+
+        self.assertEqual(len(self.signal.slots((int, str))), 2)
+        del tf
+        self.assertEqual(len(self.signal.slots((int, str))), 1)
+        self.assertEqual(len(self.signal._connections), 1)
+
+    def test_many_instances(self):
+        # the same method of many instances is one connection per instance
+        instances = [TestFuncs() for _ in range(100)]
+        for tf in instances:
+            self.signal.connect(tf.method_w_typing)
+        del tf
+        self.assertEqual(len(self.signal.slots((int, str))), 100)
+
+        self.signal.disconnect(instances[0].method_w_typing)
+        self.assertNotIn(instances[0].method_w_typing, self.signal.slots((int, str)))
+        self.assertIn(instances[1].method_w_typing, self.signal.slots((int, str)))
+        # disconnecting twice, or a slot never connected, does nothing
+        self.signal.disconnect(instances[0].method_w_typing)
+        self.signal.disconnect(func_w_typing)
+
+        del instances[:50]
+        self.assertEqual(len(self.signal.slots((int, str))), 50)
+        self.assertEqual(len(self.signal._connections), 50)
+        self.assertTrue(self.signal.connected)
+        instances.clear()
+        self.assertFalse(self.signal.connected)
+
+    def test_dispatch_table(self):
+        tf = TestFuncs()
+        self.signal.connect(func_w_typing)
+        self.signal.emit(1, "a")
+        signals.join()
+
+        # first emission compiles the entry for the exact argument types
+        self.assertEqual(len(self.signal._dispatch[(int, str)]), 1)
+
+        # connecting afterwards updates the compiled entry in place
+        self.signal.connect(tf.method)
+        self.assertEqual(len(self.signal._dispatch[(int, str)]), 2)
+
+        # connecting twice does not duplicate the slot
+        self.signal.connect(tf.method)
+        self.assertEqual(len(self.signal._dispatch[(int, str)]), 2)
+
+        # disconnected slots are dropped from the entry on its next emission
+        self.signal.disconnect(func_w_typing)
+        global test_results
+        test_results = {}
+        self.signal.emit(2, "b")
+        self.assertEqual(len(self.signal._dispatch[(int, str)]), 1)
+        signals.join()
+        self.assertEqual(test_results, {"method": (2, "b")})
+        signals.shutdown()
+
+    def test_emit_many(self):
+        received = []
+
+        def collect(v1: int, v2: str):
+            received.append((v1, v2))
+
+        def generic(v1, v2):
+            received.append(('generic', v1, v2))
+
+        self.signal.connect(collect)
+        self.signal.connect(generic)
+
+        emissions = [(i, str(i)) for i in range(100)]
+        futures = self.signal.emit_many(emissions, futures=True)
+        # one work item per slot for the single (int, str) group
+        self.assertEqual(len(futures), 2)
+        for f in futures:
+            f.result(timeout=5)
+
+        self.assertEqual([r for r in received if r[0] != 'generic'], emissions)
+        self.assertEqual(len(received), 200)
+        self.assertIsNone(self.signal.emit_many([(1, "a")]))
+        signals.join()
+        signals.shutdown()
+
+    def test_dispatch_modes(self):
+        threads = {}
+
+        def direct(v1: int, v2: str):
+            threads['direct'] = threading.current_thread()
+
+        def queued(v1, v2):
+            threads['queued'] = threading.current_thread()
+
+        def cascade(v: int):
+            threads['cascade'] = threading.current_thread()
+
+        auto = signals.Signal([int], dispatch=signals.DispatchMode.AUTO)
+        auto.connect(cascade)
+
+        def emitter(v1: int, v2: str):
+            threads['emitter'] = threading.current_thread()
+            auto.emit(v1)
+
+        self.signal.connect(direct, dispatch=signals.DispatchMode.DIRECT)
+        self.signal.connect(queued)
+        self.signal.connect(emitter)
+        self.signal.emit(1, "a")
+
+        # the direct slot already ran, on this thread
+        self.assertIs(threads['direct'], threading.current_thread())
+        signals.join()
+        self.assertIsNot(threads['queued'], threading.current_thread())
+        # AUTO emitted from a worker runs on that same worker
+        self.assertIs(threads['cascade'], threads['emitter'])
+
+        # AUTO emitted from a non-worker thread is queued
+        auto.emit(2)
+        signals.join()
+        self.assertIsNot(threads['cascade'], threading.current_thread())
+
+        # reconnecting changes the mode of an existing connection
+        self.signal.connect(direct, dispatch=signals.DispatchMode.QUEUED)
+        self.signal.emit(2, "b")
+        signals.join()
+        self.assertIsNot(threads['direct'], threading.current_thread())
+
+        self.assertRaises(ValueError, self.signal.connect, func, dispatch='sync')
+        self.assertRaises(ValueError, signals.Signal, [int], dispatch='sync')
+        signals.shutdown()
 
     def test_emission(self):
         tf = TestFuncs()
@@ -170,3 +321,367 @@ class TestSignal(unittest.TestCase):
             self.assertTrue(test_results[slot.__name__] == (6, "Boo"))
 
         signals.shutdown()
+
+    def test_coalescing(self):
+        received = []
+        gate = threading.Event()
+        signals.getSignalProcessor(thread_ct=1).submit(gate.wait)
+
+        def latest(v: int):
+            received.append(('latest', v))
+
+        def summed(v: int):
+            received.append(('summed', v))
+
+        coalescing = signals.Signal([int], coalesce=True)
+        reducing = signals.Signal([int], coalesce=lambda old, new: (old[0] + new[0],))
+        coalescing.connect(latest)
+        reducing.connect(summed)
+        # the only worker is held, so every emission after the first finds one pending
+        for i in range(1, 101):
+            coalescing.emit(i)
+            reducing.emit(i)
+        gate.set()
+        signals.join()
+        self.assertEqual(sorted(received), [('latest', 100), ('summed', 5050)])
+        self.assertEqual(coalescing.coalesced, 99)
+
+        # a slot disconnected while pending does not run
+        received.clear()
+        gate.clear()
+        signals.getSignalProcessor().submit(gate.wait)
+        coalescing.emit(1)
+        coalescing.disconnect(latest)
+        gate.set()
+        signals.join()
+        self.assertEqual(received, [])
+
+        self.assertRaises(ValueError, signals.Signal, [int], debounce=1, throttle=1)
+        self.assertRaises(TypeError, signals.Signal, [int], coalesce='yes')
+        signals.shutdown()
+
+    def test_coalescing_bounded_queue(self):
+        # a full queue must not lose the work item running a pending emission
+        for overflow in (signals.OverflowPolicy.DROP_NEWEST, signals.OverflowPolicy.DROP_OLDEST,
+                         signals.OverflowPolicy.RAISE):
+            received = []
+
+            def slot(v: int):
+                received.append(v)
+
+            processor = signals.getSignalProcessor(thread_ct=1, max_queue=1, overflow=overflow)
+            signal = signals.Signal([int], coalesce=True, priority=signals.SignalPriority.LOW)
+            signal.connect(slot)
+            gate = threading.Event()
+            started = threading.Event()
+            processor.submit(lambda: (started.set(), gate.wait()))
+            started.wait()
+            processor.submit(int)
+            signal.emit(0)
+            gate.set()
+            signals.join()
+            self.assertEqual(received, [0], msg=overflow)
+            for i in range(1, 5):
+                signal.emit(i)
+            signals.join()
+            self.assertEqual(received[0], 0)
+            self.assertEqual(received[-1], 4, msg=overflow)
+            signals.shutdown()
+
+    def test_debounce_throttle(self):
+        received = []
+
+        def slot(v: int):
+            received.append(v)
+
+        debounced = signals.Signal([int], debounce=0.05)
+        debounced.connect(slot)
+        for i in range(10):
+            debounced.emit(i)
+        signals.join()
+        # nothing runs until the signal has been quiet for the window
+        self.assertEqual(received, [])
+        time.sleep(0.2)
+        signals.join()
+        self.assertEqual(received, [9])
+
+        received.clear()
+        throttled = signals.Signal([int], throttle=60)
+        throttled.connect(slot)
+        for i in range(10):
+            throttled.emit(i)
+        signals.join()
+        # leading run at once, the rest folded into one trailing run
+        self.assertEqual(received, [0])
+        throttled.flush()
+        signals.join()
+        self.assertEqual(received, [0, 9])
+        signals.shutdown()
+
+    def test_connection_handles(self):
+        tf = TestFuncs()
+        connection = self.signal.connect(func_w_typing)
+        self.assertIsInstance(connection, signals.Connection)
+        self.assertIs(connection.signal, self.signal)
+        self.assertIs(connection.slot, func_w_typing)
+        # reconnecting returns the existing connection
+        self.assertIs(self.signal.connect(func_w_typing), connection)
+
+        connection.disconnect()
+        self.assertFalse(connection.connected)
+        self.assertEqual(len(self.signal.slots((int, str))), 0)
+        connection.disconnect()
+
+        # a stale handle does not disconnect a newer connection of the same slot
+        newer = self.signal.connect(func_w_typing)
+        connection.disconnect()
+        self.assertTrue(newer.connected)
+        newer.disconnect()
+
+        with self.signal.connect(tf.method) as scoped:
+            self.assertIn(tf.method, self.signal.slots((int, str)))
+        self.assertFalse(scoped.connected)
+        self.assertFalse(self.signal.connected)
+
+    def test_connection_group(self):
+        others = [signals.Signal([int, str]) for _ in range(10)]
+        instances = [TestFuncs() for _ in range(100)]
+        with signals.ConnectionGroup() as group:
+            for signal in [self.signal] + others:
+                for tf in instances:
+                    group.connect(signal, tf.method)
+            self.assertEqual(len(group), 1100)
+            self.assertEqual(len(self.signal.slots((int, str))), 100)
+        self.assertEqual(len(group), 0)
+        self.assertFalse(any(s.connected for s in [self.signal] + others))
+
+    def test_variadic_slots(self):
+        received = []
+
+        def anything(*args):
+            received.append(('anything', args))
+
+        def ints(first: int, *rest: int):
+            received.append(('ints', (first, *rest)))
+
+        def optional(v: int, label: str = 'none'):
+            received.append(('optional', (v, label)))
+
+        signal = signals.Signal([int], [int, str], [int, int, int])
+        signal.connect(anything)
+        signal.connect(ints)
+        signal.connect(optional)
+        # matched once per accepted number of arguments, at connection time
+        self.assertEqual(len(signal._connections[id(anything)].typedefs), 3)
+        # as for fixed slots, types no explicit typedef fits fall back to the generic
+        #   one, though the slot's annotations still filter what it receives
+        self.assertEqual(signal._connections[id(ints)].typedefs,
+                         ((int,), (object, object), (int, int, int)))
+        self.assertEqual(sorted(map(len, signal._connections[id(optional)].typedefs)), [1, 2])
+
+        for args in ((1,), (2, 'b'), (3, 4, 5)):
+            signal.emit(*args)
+        signals.join()
+        self.assertEqual(sorted(received), [
+            ('anything', (1,)), ('anything', (2, 'b')), ('anything', (3, 4, 5)),
+            ('ints', (1,)), ('ints', (3, 4, 5)),
+            ('optional', (1, 'none')), ('optional', (2, 'b'))])
+        signals.shutdown()
+
+    def test_keyword_emission(self):
+        received = []
+
+        def positional(v: int):
+            received.append(('positional', v))
+
+        def labelled(v: int, label: str = 'none'):
+            received.append(('labelled', v, label))
+
+        def keyword_only(v: int, *, unit: str):
+            received.append(('keyword_only', v, unit))
+
+        def extras(v: int, **extra: str):
+            received.append(('extras', v, extra))
+
+        signal = signals.Signal([int])
+        for slot in (positional, labelled, keyword_only, extras):
+            signal.connect(slot)
+
+        signal.emit(1)
+        signals.join()
+        # a required keyword-only parameter keeps the slot out of plain emissions
+        self.assertEqual(sorted(r[0] for r in received), ['extras', 'labelled', 'positional'])
+
+        received.clear()
+        signal.emit(2, label='two')
+        signals.join()
+        self.assertEqual(sorted(received, key=str),
+                         [('extras', 2, {'label': 'two'}), ('labelled', 2, 'two')])
+
+        received.clear()
+        signal.emit(3, unit='m')
+        # an int does not fit **extra: str
+        signal.emit(4, unit=5)
+        signals.join()
+        self.assertEqual(sorted(received, key=str),
+                         [('extras', 3, {'unit': 'm'}), ('keyword_only', 3, 'm')])
+        self.assertEqual(len(signal._kw_dispatch), 3)
+        signals.shutdown()
+
+    def test_serial_slots(self):
+        lock = threading.Lock()
+        running = [0, 0]  # current, most at once
+        received = []
+        gate = threading.Event()
+
+        def slot(v: int):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            gate.wait()
+            received.append(v)
+            with lock:
+                running[0] -= 1
+
+        signals.getSignalProcessor(thread_ct=4)
+        signal = signals.Signal([int])
+        connection = signal.connect(slot, serial=True)
+        self.assertTrue(connection.serial)
+        for i in range(100):
+            signal.emit(i)
+        signal.emit_many([(i,) for i in range(100, 150)])
+        # one work item drains the mailbox; nothing else occupies the pool
+        self.assertLessEqual(signals.processorStats()['default']['queued'], 1)
+        gate.set()
+        signals.join()
+        self.assertEqual(received, list(range(150)))
+        self.assertEqual(running[1], 1)
+
+        async def emit_async():
+            return await signal.emit_async(7)
+
+        def double(v: int):
+            return v * 2
+
+        signal.connect(double, serial=True)
+        self.assertEqual(sorted(asyncio.run(emit_async()), key=str), [14, None])
+
+        # messages of a disconnected slot are dropped
+        gate.clear()
+        received.clear()
+        signal.emit(1)
+        signal.emit(2)
+        connection.disconnect()
+        gate.set()
+        signals.join()
+        self.assertLessEqual(len(received), 1)
+
+        self.assertRaises(ValueError, signal.connect, double,
+                          dispatch=signals.DispatchMode.DIRECT, serial=True)
+        signals.shutdown()
+
+    def test_serial_slots_bounded_queue(self):
+        # a full queue must not lose the work item draining a mailbox
+        for overflow in (signals.OverflowPolicy.DROP_NEWEST, signals.OverflowPolicy.DROP_OLDEST,
+                         signals.OverflowPolicy.RAISE):
+            received = []
+
+            def slot(v: int):
+                received.append(v)
+
+            processor = signals.getSignalProcessor(thread_ct=1, max_queue=1, overflow=overflow)
+            signal = signals.Signal([int], priority=signals.SignalPriority.LOW)
+            connection = signal.connect(slot, serial=True)
+            gate = threading.Event()
+            started = threading.Event()
+            processor.submit(lambda: (started.set(), gate.wait()))
+            started.wait()
+            processor.submit(int)
+            signal.emit(0)
+            gate.set()
+            signals.join()
+            for i in range(1, 5):
+                signal.emit(i)
+            signals.join()
+            self.assertEqual(received, [0, 1, 2, 3, 4], msg=overflow)
+            self.assertFalse(connection.mailbox.scheduled)
+            signals.shutdown()
+
+    def test_keyed_emission(self):
+        lock = threading.Lock()
+        running = {}
+        overlapped = []
+        threads = set()
+        received = {}
+
+        def slot(account: str, seq: int):
+            with lock:
+                if running.get(account):
+                    overlapped.append(account)
+                running[account] = True
+                threads.add(threading.current_thread())
+            time.sleep(0.001)
+            received.setdefault(account, []).append(seq)
+            with lock:
+                running[account] = False
+
+        signals.getSignalProcessor(thread_ct=4)
+        signal = signals.Signal([str, int], key=lambda account, seq: account, lanes=8)
+        signal.connect(slot)
+        accounts = [f'acct{i}' for i in range(8)]
+        for seq in range(20):
+            for account in accounts:
+                signal.emit(account, seq)
+        signal.emit_many([('acct0', 20), ('acct1', 20)])
+        signals.join()
+        # each key in order and one at a time, different keys in parallel
+        self.assertEqual(overlapped, [])
+        for account in accounts:
+            expected = list(range(21)) if account in ('acct0', 'acct1') else list(range(20))
+            self.assertEqual(received[account], expected)
+        self.assertGreater(len(threads), 1)
+
+        # an explicit key overrides the key function
+        received.clear()
+        for seq in range(10):
+            signal.emit_keyed('shared', f'acct{seq % 2}', seq)
+        signals.join()
+        self.assertEqual(received, {'acct0': [0, 2, 4, 6, 8], 'acct1': [1, 3, 5, 7, 9]})
+
+        # lane mailboxes are created as lanes are first used
+        lazy = signals.Signal([str, int], key=lambda account, seq: account, lanes=8)
+        connection = lazy.connect(slot)
+        self.assertEqual(connection.lanes, {})
+        lazy.emit_keyed('shared', 'acct0', 0)
+        lazy.emit_keyed('shared', 'acct0', 1)
+        self.assertEqual(list(connection.lanes), [hash('shared') % 8])
+        signals.join()
+
+        self.assertRaises(ValueError, signals.Signal, [int], key=str, coalesce=True)
+        self.assertRaises(ValueError, signals.Signal, [int], key=str, lanes=0)
+        self.assertRaises(TypeError, signals.Signal, [int], key='account')
+        self.assertRaises(ValueError, signal.connect, slot, dispatch=signals.DispatchMode.DIRECT)
+        signals.shutdown()
+
+        # lanes keep delivering after their drain items met a full queue
+        processor = signals.getSignalProcessor(thread_ct=1, max_queue=1,
+                                               overflow=signals.OverflowPolicy.DROP_NEWEST)
+        signal = signals.Signal([str, int], key=lambda account, seq: account, lanes=4)
+        signal.connect(slot)
+        received.clear()
+        gate = threading.Event()
+        started = threading.Event()
+        processor.submit(lambda: (started.set(), gate.wait()))
+        started.wait()
+        processor.submit(int)
+        for account in accounts:
+            signal.emit(account, 0)
+        gate.set()
+        signals.join()
+        for seq in range(1, 5):
+            for account in accounts:
+                signal.emit(account, seq)
+        signals.join()
+        self.assertEqual(received, {account: list(range(5)) for account in accounts})
+        self.assertEqual(processor.dropped, 0)
+        signals.shutdown()